@@ -24,15 +24,33 @@ from xfeed.config import (
     load_objectives,
     ensure_setup,
     CONFIG_DIR,
+    close_async_client,
 )
 from xfeed.filter import filter_tweets
 from xfeed.models import FilteredTweet
-from xfeed.fetcher import fetch_timeline, fetch_all_engagement, fetch_since
+from xfeed.fetcher import close_browser, fetch_timeline, fetch_all_engagement, fetch_since
 
 
 console = Console()
 
 
+def run_async(coro):
+    """Run a coroutine with asyncio.run.
+
+    The shared browser and Anthropic client are closed before the loop ends.
+    """
+    async def run_and_close():
+        try:
+            return await coro
+        finally:
+            try:
+                await close_browser()
+            finally:
+                await close_async_client()
+
+    return asyncio.run(run_and_close())
+
+
 def print_tweet(filtered_tweet: FilteredTweet) -> None:
     """Print a filtered tweet to the console."""
     tweet = filtered_tweet.tweet
@@ -104,7 +122,7 @@ def fetch(count: int, threshold: int | None, raw: bool, json_output: bool):
         task = progress.add_task("Fetching tweets from X...", total=None)
 
         try:
-            tweets, _my_handle = asyncio.run(fetch_timeline(
+            tweets, _my_handle = run_async(fetch_timeline(
                 count=count,
                 headless=True,
                 on_progress=lambda current, total: progress.update(
@@ -259,7 +277,8 @@ def ticker(rotate: int, refresh: int, count: int, threshold: int, compact: bool)
             tweets, _my_handle = await fetch_timeline(count=count, headless=True)
             if not tweets:
                 return []
-            return filter_tweets(tweets, threshold=threshold)
+            # Off the event loop: filtering blocks on the API and SQLite
+            return await asyncio.to_thread(filter_tweets, tweets, threshold=threshold)
         except Exception as e:
             console.print(f"[red]Fetch error:[/red] {e}")
             return []
@@ -269,7 +288,7 @@ def ticker(rotate: int, refresh: int, count: int, threshold: int, compact: bool)
         console.print(f"[dim]Rotate: {rotate}s │ Refresh: {refresh}min │ Threshold: {threshold}/10[/dim]")
         console.print("[dim]Press Ctrl+C to stop[/dim]\n")
 
-    asyncio.run(run_ticker(
+    run_async(run_ticker(
         fetch_func=fetch_filtered,
         rotate_seconds=rotate,
         refresh_minutes=refresh,
@@ -333,7 +352,7 @@ def mosaic(refresh: int, count: int, threshold: int, engagement: bool, fresh: bo
     console.print("[bold red]Starting XFEED Mosaic[/bold red]")
     console.print(f"[dim]Refresh: {refresh}min │ Threshold: {threshold}+[/dim]\n")
 
-    asyncio.run(run_mosaic(
+    run_async(run_mosaic(
         fetch_func=fetch_filtered,
         vibe_func=extract_vibe,
         refresh_minutes=refresh,
@@ -399,7 +418,9 @@ def watch(interval: int, count: int, threshold: int, top: int):
         try:
             tweets, _my_handle = await fetch_timeline(count=count, headless=True)
             if tweets:
-                filtered = filter_tweets(tweets, threshold=threshold)
+                filtered = await asyncio.to_thread(
+                    filter_tweets, tweets, threshold=threshold
+                )
                 print_update(filtered)
             else:
                 print_update([])
@@ -412,7 +433,7 @@ def watch(interval: int, count: int, threshold: int, top: int):
 
     try:
         while True:
-            asyncio.run(fetch_and_print())
+            run_async(fetch_and_print())
             time.sleep(interval * 60)
     except KeyboardInterrupt:
         console.print("\n[magenta dim]XFEED watch stopped[/magenta dim]")
@@ -473,7 +494,7 @@ def digest(since: float | None, count: int, threshold: int):
         task = progress.add_task("Fetching timeline...", total=None)
 
         try:
-            tweets, _my_handle = asyncio.run(fetch_since(
+            tweets, _my_handle = run_async(fetch_since(
                 since=since_time,
                 max_count=count,
                 headless=True,
@@ -1,9 +1,11 @@
 """Configuration management for XFeed."""
 
+import asyncio
 import json
 import os
 import subprocess
 import sys
+import weakref
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -108,6 +110,45 @@ def get_api_key() -> str | None:
     return config.get("anthropic_api_key") or None
 
 
+# Async client shared by every LLM call on an event loop, so its connection
+# pool (and TLS session) carries over: loop -> (api key, client). The pool
+# can't move between loops, so each loop gets its own; entries go away with
+# their loops.
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+async def get_async_client(api_key: str):
+    """Return the running loop's shared async Anthropic client.
+
+    Created on first use; a client for a different API key is closed and
+    replaced. The SDK is imported here so other commands don't load it.
+    """
+    import anthropic
+
+    loop = asyncio.get_running_loop()
+    entry = _async_clients.pop(loop, None)
+    if entry is not None:
+        key, client = entry
+        if key == api_key:
+            _async_clients[loop] = entry
+            return client
+        await client.close()
+
+    client = anthropic.AsyncAnthropic(api_key=api_key)
+    _async_clients[loop] = (api_key, client)
+    return client
+
+
+async def close_async_client() -> None:
+    """Close the running loop's shared Anthropic client, if it has one.
+
+    Call before the loop ends, so its connection pool is released.
+    """
+    entry = _async_clients.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[1].close()
+
+
 def set_api_key(api_key: str) -> None:
     """Save Anthropic API key to .env file."""
     ensure_config_dir()
@@ -13,6 +13,10 @@ from xfeed.config import get_api_key, load_objectives
 from xfeed.models import FilteredTweet, Digest, DigestTopic
 
 
+# Matches the outermost JSON object in a model response
+JSON_OBJECT_PATTERN = re.compile(r'\{[\s\S]*\}')
+
+
 CLUSTER_SYSTEM_PROMPT = """You are a tweet analyst. Your job is to cluster tweets into 3-5 meaningful topics that help someone catch up on what they missed.
 
 The user cares about these topics:
@@ -65,7 +69,7 @@ def format_tweets_for_clustering(tweets: list[FilteredTweet]) -> str:
 def parse_cluster_response(response_text: str) -> dict:
     """Parse the JSON response from clustering."""
     # Try to extract JSON object from response
-    json_match = re.search(r'\{[\s\S]*\}', response_text)
+    json_match = JSON_OBJECT_PATTERN.search(response_text)
     if json_match:
         try:
             return json.loads(json_match.group())
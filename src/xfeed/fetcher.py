@@ -1,14 +1,27 @@
 """X timeline fetcher using Playwright."""
 
 import asyncio
+import json
+import os
 import random
+import logging
 import re
-from datetime import datetime, timedelta
+import time
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 
 import browser_cookie3
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import async_playwright, Browser, Page, Playwright
 
+from xfeed.config import CONFIG_DIR, ensure_config_dir
 from xfeed.models import Tweet, QuotedTweet, Notification, NotificationType, ThreadContext
+from xfeed.session import load_recent_cached_tweets
+
+logger = logging.getLogger(__name__)
 
 
 # =============================================================================
@@ -21,6 +34,14 @@ from xfeed.models import Tweet, QuotedTweet, Notification, NotificationType, Thr
 SCROLL_DELAY_MIN = 400   # Minimum ms between scrolls
 SCROLL_DELAY_MAX = 800   # Maximum ms between scrolls
 
+# After a scroll, keep waiting past the pacing delay for unread tweets to
+# render, up to this long (ms), so slow loads aren't mistaken for the end
+NEW_TWEETS_TIMEOUT = 2000
+
+# Stop scrolling after this many passes in a row turn up nothing new (once
+# something has loaded); max_scrolls remains the hard cap
+IDLE_SCROLL_LIMIT = 2
+
 # Page load: wait for content to settle after load
 PAGE_LOAD_MIN = 800
 PAGE_LOAD_MAX = 1500
@@ -34,6 +55,13 @@ READ_PAUSE_CHANCE = 0.05  # 5% chance to pause and "read"
 READ_PAUSE_MIN = 500
 READ_PAUSE_MAX = 1000
 
+# Dedicated RNG for pacing delays, drawn from in every scroll iteration.
+# Bound methods skip the module/attribute lookup on each call and keep
+# pacing draws out of the global random stream.
+_pacing_rng = random.Random()
+_randint = _pacing_rng.randint
+_random = _pacing_rng.random
+
 # =============================================================================
 # Resource blocking - skip loading things we don't need
 # =============================================================================
@@ -55,8 +83,40 @@ BLOCKED_URL_PATTERNS = [
 # Rate limiting: minimum time between full fetch sessions (seconds)
 MIN_FETCH_INTERVAL = 120  # 2 minutes minimum between full refreshes
 
-# Track last fetch time for rate limiting
-_last_fetch_time: datetime | None = None
+# Track last fetch time for rate limiting (time.monotonic() seconds, immune
+# to wall-clock changes)
+_last_fetch_time: float | None = None
+
+# Chrome cookies are reused for this long (seconds) before being re-read;
+# reading them copies and decrypts Chrome's cookie database.
+COOKIE_CACHE_TTL = 300
+
+# (time.monotonic() when read, cookies) from the last session read
+_cookie_cache: tuple[float, list[dict]] | None = None
+
+# The session read from Chrome is also saved here, in Playwright storage_state
+# format, so later runs skip Chrome's cookie database (and keychain prompts)
+# until the session expires or X sends us to the login page
+SESSION_STATE_FILE = CONFIG_DIR / "x_state.json"
+SESSION_AUTH_COOKIE = "auth_token"  # A saved session without it is unusable
+
+# X uses both domains
+X_COOKIE_DOMAINS = (".x.com", ".twitter.com")
+
+# Logged-in handle per page; entries go away with their pages
+_logged_in_users: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Playwright driver shared by every fetch on an event loop, started on first
+# use: (owning loop, playwright)
+_shared_playwright: tuple[asyncio.AbstractEventLoop, Playwright] | None = None
+
+# Chromium per headless mode on the shared driver, launched on first use.
+# Each fetch opens and closes its own context on it, so a fetch in one mode
+# never closes a browser another fetch is using.
+_shared_browsers: dict[bool, Browser] = {}
+
+# Launch lock per event loop (asyncio locks can't move between loops)
+_browser_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
 
 async def _block_unnecessary_resources(route):
@@ -81,27 +141,27 @@ async def _block_unnecessary_resources(route):
 
 def _scroll_delay() -> int:
     """Get a variable delay for scrolling (ms)."""
-    base = random.randint(SCROLL_DELAY_MIN, SCROLL_DELAY_MAX)
+    base = _randint(SCROLL_DELAY_MIN, SCROLL_DELAY_MAX)
     # Occasionally add extra "reading" time
-    if random.random() < READ_PAUSE_CHANCE:
-        base += random.randint(READ_PAUSE_MIN, READ_PAUSE_MAX)
+    if _random() < READ_PAUSE_CHANCE:
+        base += _randint(READ_PAUSE_MIN, READ_PAUSE_MAX)
     return base
 
 
 def _page_load_delay() -> int:
     """Get a variable delay after page load (ms)."""
-    return random.randint(PAGE_LOAD_MIN, PAGE_LOAD_MAX)
+    return _randint(PAGE_LOAD_MIN, PAGE_LOAD_MAX)
 
 
 def _nav_delay() -> int:
     """Get a variable delay between page navigations (ms)."""
-    return random.randint(NAV_PAUSE_MIN, NAV_PAUSE_MAX)
+    return _randint(NAV_PAUSE_MIN, NAV_PAUSE_MAX)
 
 
 def _jitter(base_seconds: int, jitter_pct: float = 0.2) -> int:
     """Add random jitter to a time value. Returns seconds."""
     jitter_range = int(base_seconds * jitter_pct)
-    return base_seconds + random.randint(-jitter_range, jitter_range)
+    return base_seconds + _randint(-jitter_range, jitter_range)
 
 
 def _check_rate_limit() -> bool:
@@ -109,85 +169,424 @@ def _check_rate_limit() -> bool:
     global _last_fetch_time
     if _last_fetch_time is None:
         return True
-    elapsed = (datetime.now() - _last_fetch_time).total_seconds()
-    return elapsed >= MIN_FETCH_INTERVAL
+    return time.monotonic() - _last_fetch_time >= MIN_FETCH_INTERVAL
 
 
 def _update_fetch_time():
     """Update the last fetch timestamp."""
     global _last_fetch_time
-    _last_fetch_time = datetime.now()
+    _last_fetch_time = time.monotonic()
+
+
+async def _get_browser(headless: bool = True) -> Browser:
+    """Return the shared browser for a headless mode, launching it on first use."""
+    global _shared_playwright
+    loop = asyncio.get_running_loop()
+    lock = _browser_locks.get(loop)
+    if lock is None:
+        lock = _browser_locks[loop] = asyncio.Lock()
+
+    async with lock:
+        if _shared_playwright is not None and _shared_playwright[0] is not loop:
+            # Its loop ended without close_browser(); the objects can't be
+            # awaited from this loop, so just let them go
+            logger.warning("Dropping a browser left open by a finished event loop")
+            _shared_playwright = None
+            _shared_browsers.clear()
+
+        browser = _shared_browsers.get(headless)
+        if browser is not None and browser.is_connected():
+            return browser
+
+        if _shared_playwright is None:
+            _shared_playwright = (loop, await async_playwright().start())
+        browser = await _shared_playwright[1].chromium.launch(headless=headless)
+        _shared_browsers[headless] = browser
+        return browser
+
+
+async def close_browser() -> None:
+    """Close the shared browsers if the running event loop launched them.
+
+    Call before the loop ends; browsers left open can't be closed from
+    another loop.
+    """
+    global _shared_playwright
+    if _shared_playwright is None or _shared_playwright[0] is not asyncio.get_running_loop():
+        return
+
+    _, playwright = _shared_playwright
+    _shared_playwright = None
+    browsers = list(_shared_browsers.values())
+    _shared_browsers.clear()
+    try:
+        for browser in browsers:
+            await browser.close()
+    finally:
+        await playwright.stop()
+
+
+async def _scroll_and_wait(page: Page) -> None:
+    """Scroll down one viewport, then let new content load.
+
+    The pacing delay starts alongside the scroll instead of after its
+    round-trip, so the two overlap rather than add up.
+    """
+    await asyncio.gather(
+        page.evaluate("window.scrollBy(0, window.innerHeight)"),
+        page.wait_for_timeout(_scroll_delay()),
+    )
 
 
 # =============================================================================
 # Selectors for X's DOM - these may need updating if X changes their structure
 TWEET_SELECTOR = 'article[data-testid="tweet"]'
+NOTIFICATION_SELECTOR = "article"
+STATUS_LINK_SELECTOR = 'a[href*="/status/"]'
+USER_LINK_SELECTOR = 'a[role="link"]'
 TWEET_TEXT_SELECTOR = '[data-testid="tweetText"]'
 USER_NAME_SELECTOR = '[data-testid="User-Name"]'
-LIKE_COUNT_SELECTOR = '[data-testid="like"] span'
-RETWEET_COUNT_SELECTOR = '[data-testid="retweet"] span'
-REPLY_COUNT_SELECTOR = '[data-testid="reply"] span'
 LIKE_BUTTON_SELECTOR = '[data-testid="like"]'
 RETWEET_BUTTON_SELECTOR = '[data-testid="retweet"]'
+REPLY_BUTTON_SELECTOR = '[data-testid="reply"]'
+BUTTON_COUNT_SELECTOR = "span"  # Count shown inside an engagement button
 TIME_SELECTOR = "time"
+TWEET_PHOTO_SELECTOR = '[data-testid="tweetPhoto"]'
+VIDEO_PLAYER_SELECTOR = '[data-testid="videoPlayer"]'
+MEDIA_SELECTOR = f"{TWEET_PHOTO_SELECTOR}, {VIDEO_PLAYER_SELECTOR}"  # Photo or video
 # Quote tweet is embedded in a card/container - try multiple selectors
 QUOTE_TWEET_SELECTOR = '[data-testid="quoteTweet"]'
 QUOTE_TWEET_ALT_SELECTOR = 'div[role="link"][tabindex="0"]'  # Fallback
+CARD_WRAPPER_SELECTOR = 'div[data-testid="card.wrapper"]'
 # Profile link for detecting logged-in user
 PROFILE_LINK_SELECTOR = 'a[data-testid="AppTabBar_Profile_Link"]'
 
+# In-page extraction: one page.evaluate call returns the fields of every
+# visible article, instead of a CDP round-trip per field per article.
+EXTRACT_TWEETS_JS = """
+([s, skipIds, scroll, knownIds]) => {
+    const text = (el) => (el ? el.innerText : null);
+    const attr = (el, name) => (el ? el.getAttribute(name) : null);
+    // Engagement count: the first span inside its button
+    const count = (button) => text(button && button.querySelector(s.buttonCount));
+    const names = Object.keys(s.fields);
+    const skip = new Set(skipIds);
+    const known = new Set(knownIds);
+    const rows = Array.from(document.querySelectorAll(s.tweet), (article) => {
+        // Already-collected tweets (same id rule as tweet_from_fields)
+        // return null before any other field is read
+        const href = attr(article.querySelector(s.fields.statusLink), "href") || "";
+        const id = href.includes("/status/")
+            ? href.split("/status/").pop().split("?")[0] : "";
+        if (id && skip.has(id)) {
+            return null;
+        }
+        // Tweets the caller already has: only the engagement state changes
+        if (id && known.has(id)) {
+            const like = article.querySelector(s.fields.likeButton);
+            const retweet = article.querySelector(s.fields.retweetButton);
+            return {
+                href,
+                known: true,
+                likes: count(like),
+                retweets: count(retweet),
+                replies: count(article.querySelector(s.fields.replyButton)),
+                likedByMe: /unlike/i.test(attr(like, "aria-label") || ""),
+                retweetedByMe: /undo/i.test(attr(retweet, "aria-label") || ""),
+            };
+        }
+        // One subtree walk for all field selectors. Nodes come back in
+        // document order, so the first match per field is exactly what
+        // article.querySelector(selector) would return. Stops as soon as
+        // every field (media included) has been found.
+        const el = {};
+        let missing = names.length;
+        for (const node of article.querySelectorAll(s.combined)) {
+            for (const name of names) {
+                if (!(name in el) && node.matches(s.fields[name])) {
+                    el[name] = node;
+                    missing--;
+                }
+            }
+            if (missing === 0) {
+                break;
+            }
+        }
+        // Quote tweets: primary selector, else a card wrapping tweet text
+        let quote = el.quote || null;
+        if (!quote) {
+            quote = Array.from(article.querySelectorAll(s.card))
+                .find((card) => card.querySelector(s.fields.text)) || null;
+        }
+        return {
+            href: attr(el.statusLink, "href"),
+            userText: text(el.userName),
+            content: text(el.text),
+            time: attr(el.time, "datetime"),
+            timeText: text(el.time),
+            likes: count(el.likeButton),
+            retweets: count(el.retweetButton),
+            replies: count(el.replyButton),
+            hasMedia: !!el.media,
+            // Liked/retweeted state as flags rather than the full aria-labels:
+            // "9 Likes. Unlike" once liked, "0 reposts. Undo repost" once
+            // retweeted
+            likedByMe: /unlike/i.test(attr(el.likeButton, "aria-label") || ""),
+            retweetedByMe: /undo/i.test(attr(el.retweetButton, "aria-label") || ""),
+            quoteUserText: quote ? text(quote.querySelector(s.fields.userName)) : null,
+            quoteContent: quote ? text(quote.querySelector(s.fields.text)) : null,
+            // Only the flag crosses over, not the article's whole text
+            isReply: article.innerText.toLowerCase().includes("replying to"),
+        };
+    });
+    // Scroll on for the next pass in the same round-trip
+    if (scroll) {
+        window.scrollBy(0, window.innerHeight);
+    }
+    return rows;
+}
+"""
+
+# Polled after a scroll: true once an article with an unread tweet id is in
+# the page (same id rule as EXTRACT_TWEETS_JS)
+NEW_TWEETS_JS = """
+([s, seenIds]) => {
+    const seen = new Set(seenIds);
+    return Array.from(document.querySelectorAll(s.tweet)).some((article) => {
+        const link = article.querySelector(s.fields.statusLink);
+        const href = (link && link.getAttribute("href")) || "";
+        return href.includes("/status/")
+            && !seen.has(href.split("/status/").pop().split("?")[0]);
+    });
+}
+"""
+
+# href of the first element matching a selector, or null
+LINK_HREF_JS = """
+(selector) => {
+    const link = document.querySelector(selector);
+    return link ? link.getAttribute("href") : null;
+}
+"""
+
+EXTRACT_NOTIFICATIONS_JS = """
+([s, skipKeys, scroll]) => {
+    const skip = new Set(skipKeys);
+    const rows = Array.from(document.querySelectorAll(s.notification), (article) => {
+        // Dedup key from the first actor link, the timestamp and the start
+        // of textContent (no layout pass, unlike innerText), so articles
+        // already collected are skipped before anything costly is read
+        const firstLink = article.querySelector(s.userLink);
+        const time = article.querySelector(s.time);
+        const key = [
+            firstLink ? firstLink.getAttribute("href") : "",
+            time ? time.getAttribute("datetime") : "",
+            article.textContent.slice(0, 100),
+        ].join("|");
+        if (skip.has(key)) {
+            return null;
+        }
+        return {
+            key: key,
+            text: article.innerText,
+            links: Array.from(
+                article.querySelectorAll(s.userLink),
+                (a) => [a.getAttribute("href") || "", a.innerText],
+            ),
+            time: time ? time.getAttribute("datetime") : null,
+            timeText: time ? time.innerText : null,
+            tweetTexts: Array.from(article.querySelectorAll(s.text), (el) => el.innerText),
+        };
+    });
+    if (scroll) {
+        window.scrollBy(0, window.innerHeight);
+    }
+    return rows;
+}
+"""
+
+# Per-article selectors EXTRACT_TWEETS_JS resolves with one combined
+# querySelectorAll, dispatching each matched node by the selector it matches
+TWEET_FIELD_SELECTORS = {
+    "statusLink": STATUS_LINK_SELECTOR,
+    "text": TWEET_TEXT_SELECTOR,
+    "userName": USER_NAME_SELECTOR,
+    "likeButton": LIKE_BUTTON_SELECTOR,
+    "retweetButton": RETWEET_BUTTON_SELECTOR,
+    "replyButton": REPLY_BUTTON_SELECTOR,
+    "time": TIME_SELECTOR,
+    "quote": QUOTE_TWEET_SELECTOR,
+    "media": MEDIA_SELECTOR,
+}
+
+# Selectors passed to the extraction scripts above
+EXTRACT_SELECTORS = {
+    "tweet": TWEET_SELECTOR,
+    "notification": NOTIFICATION_SELECTOR,
+    "userLink": USER_LINK_SELECTOR,
+    "text": TWEET_TEXT_SELECTOR,
+    "time": TIME_SELECTOR,
+    "card": CARD_WRAPPER_SELECTOR,
+    "buttonCount": BUTTON_COUNT_SELECTOR,
+    "fields": TWEET_FIELD_SELECTORS,
+    "combined": ", ".join(TWEET_FIELD_SELECTORS.values()),
+}
+
+
+def _playwright_cookie(cookie) -> dict:
+    """Convert a cookiejar Cookie into the dict context.add_cookies expects."""
+    return {
+        "name": cookie.name,
+        "value": cookie.value,
+        "domain": cookie.domain,
+        "path": cookie.path,
+        "secure": bool(cookie.secure),
+        "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+        "expires": cookie.expires if cookie.expires else -1,  # -1: session cookie
+    }
+
+
+def _load_saved_session() -> list[dict]:
+    """Cookies saved in SESSION_STATE_FILE, or [] if missing or expired."""
+    try:
+        cookies = json.loads(SESSION_STATE_FILE.read_text())["cookies"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return []
+
+    now = time.time()
+    cookies = [c for c in cookies if not 0 <= c.get("expires", -1) < now]
+    if not any(c.get("name") == SESSION_AUTH_COOKIE for c in cookies):
+        return []
+    return cookies
 
-def get_x_session_from_chrome() -> list[dict]:
-    """Get X/Twitter session from Chrome browser."""
+
+def _save_session(cookies: list[dict]) -> None:
+    """Save cookies to SESSION_STATE_FILE, readable by the owner only."""
+    try:
+        ensure_config_dir()
+        # Write a fresh temp file and swap it in: open()'s mode only applies
+        # on creation, so an existing file would keep looser permissions.
+        # fchmod covers a temp file left behind by an interrupted save.
+        tmp_file = SESSION_STATE_FILE.with_suffix(".json.tmp")
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"cookies": cookies, "origins": []}, f)
+        os.replace(tmp_file, SESSION_STATE_FILE)
+    except OSError:
+        pass  # Saving is only an optimization
+
+
+def forget_x_session() -> None:
+    """Drop the cached and saved session so the next fetch re-reads Chrome."""
+    global _cookie_cache
+    _cookie_cache = None
     try:
-        cj = browser_cookie3.chrome(domain_name=".x.com")
-        cookies = []
-        for cookie in cj:
-            cookies.append({
-                "name": cookie.name,
-                "value": cookie.value,
-                "domain": cookie.domain,
-                "path": cookie.path,
-                "secure": bool(cookie.secure),
-                "httpOnly": bool(cookie.has_nonstandard_attr("HttpOnly")),
-            })
-
-        # Also get twitter.com cookies (X uses both domains)
-        cj_twitter = browser_cookie3.chrome(domain_name=".twitter.com")
-        for cookie in cj_twitter:
-            cookies.append({
-                "name": cookie.name,
-                "value": cookie.value,
-                "domain": cookie.domain,
-                "path": cookie.path,
-                "secure": bool(cookie.secure),
-                "httpOnly": bool(cookie.has_nonstandard_attr("HttpOnly")),
-            })
+        SESSION_STATE_FILE.unlink()
+    except OSError:
+        pass
+
 
+def get_x_session_from_chrome() -> list[dict]:
+    """Get X/Twitter session from Chrome browser.
+
+    Cached in memory for COOKIE_CACHE_TTL, and on disk until it expires or
+    forget_x_session() is called.
+    """
+    global _cookie_cache
+    if _cookie_cache and time.monotonic() - _cookie_cache[0] < COOKIE_CACHE_TTL:
+        return _cookie_cache[1]
+
+    cookies = _load_saved_session()
+    if cookies:
+        _cookie_cache = (time.monotonic(), cookies)
         return cookies
+
+    try:
+        # One pass over Chrome's cookie store (each call copies the database
+        # and unlocks the keyring), filtered to X's domains here
+        cookies = [
+            _playwright_cookie(cookie)
+            for cookie in browser_cookie3.chrome()
+            if cookie.domain.endswith(X_COOKIE_DOMAINS)
+        ]
     except Exception as e:
         raise RuntimeError(
             f"Could not access Chrome session: {e}\n"
             "Make sure you are logged into x.com in Chrome."
         )
 
+    # Don't cache an empty session, so logging in takes effect immediately
+    if cookies:
+        _cookie_cache = (time.monotonic(), cookies)
+        _save_session(cookies)
+    return cookies
+
+
+# The parse helpers below are string, regex and datetime work on a few dozen
+# short strings per fetch, which a JIT like Numba can't speed up (object mode
+# is slower than plain CPython). They stay plain Python, made cheap with
+# precompiled patterns and lookup tables.
+
+# Multiplier for each abbreviated-count suffix ("1.2K", "3M"), in either case
+COUNT_MULTIPLIERS = {
+    suffix: multiplier
+    for letter, multiplier in {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}.items()
+    for suffix in (letter, letter.lower())
+}
+
+# Relative timestamps like "2h" or "3m", used when <time> has no datetime
+RELATIVE_TIME_PATTERN = re.compile(r"(\d+)([smhd])", re.IGNORECASE)
+
+# timedelta keyword for each relative-time unit, in either case
+RELATIVE_TIME_UNITS = {
+    unit: name
+    for letter, name in {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}.items()
+    for unit in (letter, letter.upper())
+}
+
+# "... and 3 others liked your post" in grouped notifications
+OTHERS_COUNT_PATTERN = re.compile(r"and (\d+) others?", re.IGNORECASE)
+
+# Notification phrases per type, in priority order: when phrases for several
+# types appear, the type listed first wins
+NOTIFICATION_TYPE_PHRASES = (
+    (NotificationType.LIKE, ("liked your", "likes your")),
+    (NotificationType.RETWEET, ("retweeted your", "reposted your", "retweets your", "reposts your")),
+    (NotificationType.REPLY, ("replied", "reply", "commented", "responding to")),
+    (NotificationType.QUOTE, ("quoted your", "quotes your", "quote tweeted")),
+    (NotificationType.FOLLOW, ("followed you", "follows you", "started following")),
+    (NotificationType.MENTION, ("mentioned you", "mentions you", "tagged you")),
+)
+NOTIFICATION_TYPE_BY_PHRASE = {
+    phrase: (priority, notif_type)
+    for priority, (notif_type, phrases) in enumerate(NOTIFICATION_TYPE_PHRASES)
+    for phrase in phrases
+}
+NOTIFICATION_TYPE_PATTERN = re.compile(
+    "|".join(re.escape(phrase) for phrase in NOTIFICATION_TYPE_BY_PHRASE), re.IGNORECASE
+)
+
 
 def parse_count(text: str | None) -> int:
-    """Parse engagement count strings like '1.2K' or '500'."""
+    """Parse engagement count strings like '1.2K', '3M' or '500'."""
     if not text:
         return 0
 
-    text = text.strip().upper()
+    text = text.strip()
     if not text:
         return 0
 
+    # Dispatch on the last character: most counts are plain integers, so
+    # they parse without any upper()/replace() copies.
+    suffix = text[-1]
     try:
-        if "K" in text:
-            return int(float(text.replace("K", "")) * 1000)
-        elif "M" in text:
-            return int(float(text.replace("M", "")) * 1000000)
-        else:
+        if suffix.isdigit():
             return int(text)
+        multiplier = COUNT_MULTIPLIERS.get(suffix)
+        if multiplier:
+            return int(float(text[:-1]) * multiplier)
+        return 0
     except ValueError:
         return 0
 
@@ -196,172 +595,108 @@ def parse_relative_time(time_str: str) -> datetime:
     """Parse relative time strings like '2h', '3m', '1d' to datetime."""
     now = datetime.now()
 
-    match = re.match(r"(\d+)([smhd])", time_str.lower())
+    match = RELATIVE_TIME_PATTERN.match(time_str)
     if match:
-        value = int(match.group(1))
-        unit = match.group(2)
-
-        if unit == "s":
-            return now - timedelta(seconds=value)
-        elif unit == "m":
-            return now - timedelta(minutes=value)
-        elif unit == "h":
-            return now - timedelta(hours=value)
-        elif unit == "d":
-            return now - timedelta(days=value)
+        value, unit = match.groups()
+        return now - timedelta(**{RELATIVE_TIME_UNITS[unit]: int(value)})
 
     return now
 
 
 async def get_logged_in_user(page: Page) -> str | None:
-    """Extract the logged-in user's handle from the page."""
+    """Extract the logged-in user's handle from the page (memoized per page)."""
+    cached = _logged_in_users.get(page)
+    if cached is not None:
+        return cached
+
     try:
-        profile_link = await page.query_selector(PROFILE_LINK_SELECTOR)
-        if profile_link:
-            href = await profile_link.get_attribute("href")
-            # href is like "/username" -> extract "username"
-            if href:
-                handle = href.strip("/")
-                return f"@{handle}" if not handle.startswith("@") else handle
+        # One round-trip for the lookup and the attribute read
+        href = await page.evaluate(LINK_HREF_JS, PROFILE_LINK_SELECTOR)
+        # href is like "/username" -> extract "username"
+        if href:
+            handle = href.strip("/")
+            handle = f"@{handle}" if not handle.startswith("@") else handle
+            _logged_in_users[page] = handle
+            return handle
         return None
     except Exception:
         return None
 
 
-async def extract_quoted_tweet(article) -> QuotedTweet | None:
-    """Extract quoted tweet data if present."""
-    try:
-        # Try primary selector first
-        quote_elem = await article.query_selector(QUOTE_TWEET_SELECTOR)
-
-        if not quote_elem:
-            # Try looking for a nested tweet-like structure
-            # Quote tweets often have their own tweetText and User-Name inside a card
-            inner_cards = await article.query_selector_all('div[data-testid="card.wrapper"]')
-            for card in inner_cards:
-                text_elem = await card.query_selector(TWEET_TEXT_SELECTOR)
-                if text_elem:
-                    quote_elem = card
-                    break
-
-        if not quote_elem:
-            return None
+def _split_user_text(user_text: str) -> tuple[str, str]:
+    """Split User-Name text into (display name, @handle)."""
+    lines = user_text.strip().split("\n")
+    author = lines[0] if lines else "Unknown"
+    author_handle = lines[1] if len(lines) > 1 else "@unknown"
+    return author, author_handle
 
-        # Get quoted author
-        user_elem = await quote_elem.query_selector(USER_NAME_SELECTOR)
-        if user_elem:
-            user_text = await user_elem.inner_text()
-            lines = user_text.strip().split("\n")
-            author = lines[0] if lines else "Unknown"
-            author_handle = lines[1] if len(lines) > 1 else "@unknown"
-        else:
-            # Try to find any user reference in the quote
-            author = "Unknown"
-            author_handle = "@unknown"
 
-        # Get quoted content
-        text_elem = await quote_elem.query_selector(TWEET_TEXT_SELECTOR)
-        content = await text_elem.inner_text() if text_elem else ""
+def quoted_tweet_from_fields(fields: dict) -> QuotedTweet | None:
+    """Build a QuotedTweet from extracted article fields, if present."""
+    content = fields.get("quoteContent") or ""
+    if not content:
+        return None
 
-        if not content:
-            return None
+    user_text = fields.get("quoteUserText")
+    if user_text:
+        author, author_handle = _split_user_text(user_text)
+    else:
+        # Try to find any user reference in the quote
+        author = "Unknown"
+        author_handle = "@unknown"
+
+    return QuotedTweet(
+        author=author,
+        author_handle=author_handle,
+        content=content[:500],  # Truncate long quotes
+    )
 
-        return QuotedTweet(
-            author=author,
-            author_handle=author_handle,
-            content=content[:500],  # Truncate long quotes
-        )
-    except Exception:
-        return None
 
+def tweet_from_fields(fields: dict, my_handle_lower: str | None = None) -> Tweet | None:
+    """Build a Tweet from the fields EXTRACT_TWEETS_JS returns for one article.
 
-async def extract_tweet_data(article, page: Page, my_handle: str | None = None) -> Tweet | None:
-    """Extract tweet data from an article element."""
+    my_handle_lower is the logged-in handle, already lowercased by the caller.
+    """
     try:
         # Get tweet ID from the link
-        tweet_link = await article.query_selector('a[href*="/status/"]')
-        tweet_url = await tweet_link.get_attribute("href") if tweet_link else ""
+        tweet_url = fields.get("href") or ""
         tweet_id = tweet_url.split("/status/")[-1].split("?")[0] if "/status/" in tweet_url else ""
 
         if not tweet_id:
             return None
 
         # Get author info
-        user_name_elem = await article.query_selector(USER_NAME_SELECTOR)
-        if not user_name_elem:
+        user_text = fields.get("userText")
+        if user_text is None:
             return None
+        author, author_handle = _split_user_text(user_text)
 
-        user_text = await user_name_elem.inner_text()
-        lines = user_text.strip().split("\n")
-        author = lines[0] if lines else "Unknown"
-        author_handle = lines[1] if len(lines) > 1 else "@unknown"
-
-        # Get tweet content
-        tweet_text_elem = await article.query_selector(TWEET_TEXT_SELECTOR)
-        content = await tweet_text_elem.inner_text() if tweet_text_elem else ""
+        content = fields.get("content") or ""
 
         # Get timestamp
-        time_elem = await article.query_selector(TIME_SELECTOR)
-        time_str = await time_elem.get_attribute("datetime") if time_elem else None
-
+        time_str = fields.get("time")
         if time_str:
-            timestamp = datetime.fromisoformat(time_str.replace("Z", "+00:00")).replace(tzinfo=None)
+            # X sends UTC with a "Z" suffix; dropping it parses straight to a
+            # naive datetime (3.10's fromisoformat can't read "Z" anyway)
+            if time_str.endswith("Z"):
+                timestamp = datetime.fromisoformat(time_str[:-1])
+            else:
+                timestamp = datetime.fromisoformat(time_str).replace(tzinfo=None)
         else:
-            time_text = await time_elem.inner_text() if time_elem else ""
-            timestamp = parse_relative_time(time_text)
-
-        # Get engagement counts
-        like_elem = await article.query_selector(LIKE_COUNT_SELECTOR)
-        like_text = await like_elem.inner_text() if like_elem else "0"
-
-        retweet_elem = await article.query_selector(RETWEET_COUNT_SELECTOR)
-        retweet_text = await retweet_elem.inner_text() if retweet_elem else "0"
-
-        reply_elem = await article.query_selector(REPLY_COUNT_SELECTOR)
-        reply_text = await reply_elem.inner_text() if reply_elem else "0"
+            timestamp = parse_relative_time(fields.get("timeText") or "")
 
-        # Check for media
-        has_media = bool(await article.query_selector('[data-testid="tweetPhoto"]')) or \
-                    bool(await article.query_selector('[data-testid="videoPlayer"]'))
+        # Check if this is my tweet
+        # Normalize handles for comparison (both should have @)
+        is_by_me = my_handle_lower is not None and author_handle.lower() == my_handle_lower
 
-        # Check for quoted tweet
-        quoted_tweet = await extract_quoted_tweet(article)
+        # Check if I liked / retweeted this tweet (decided in-page from the
+        # like and retweet buttons' aria-labels)
+        is_liked_by_me = bool(fields.get("likedByMe"))
+        is_retweeted_by_me = bool(fields.get("retweetedByMe"))
 
-        # Check if this is my tweet
-        is_by_me = False
-        if my_handle:
-            # Normalize handles for comparison (both should have @)
-            my_handle_norm = my_handle.lower()
-            author_handle_norm = author_handle.lower()
-            is_by_me = my_handle_norm == author_handle_norm
-
-        # Check if I liked this tweet
-        # When not liked: "9 Likes. Like" - ends with "Like"
-        # When liked: "9 Likes. Unlike" - contains "Unlike"
-        is_liked_by_me = False
-        like_button = await article.query_selector(LIKE_BUTTON_SELECTOR)
-        if like_button:
-            aria_label = await like_button.get_attribute("aria-label") or ""
-            is_liked_by_me = "unlike" in aria_label.lower()
-
-        # Check if I retweeted this tweet
-        # When not retweeted: "0 reposts. Repost" - ends with "Repost"
-        # When retweeted: "0 reposts. Undo repost" - contains "Undo"
-        is_retweeted_by_me = False
-        retweet_button = await article.query_selector(RETWEET_BUTTON_SELECTOR)
-        if retweet_button:
-            aria_label = await retweet_button.get_attribute("aria-label") or ""
-            is_retweeted_by_me = "undo" in aria_label.lower()
-
-        # Check if this tweet is a reply
-        # X shows "Replying to @handle" above reply tweets
-        is_reply = False
-        try:
-            # Look for "Replying to" text in the tweet article
-            full_text = await article.inner_text()
-            is_reply = "replying to" in full_text.lower()
-        except Exception:
-            pass
+        # Check if this tweet is a reply (decided in-page from the
+        # "Replying to @handle" line X shows above reply tweets)
+        is_reply = bool(fields.get("isReply"))
 
         return Tweet(
             id=tweet_id,
@@ -369,12 +704,12 @@ async def extract_tweet_data(article, page: Page, my_handle: str | None = None)
             author_handle=author_handle,
             content=content,
             timestamp=timestamp,
-            likes=parse_count(like_text),
-            retweets=parse_count(retweet_text),
-            replies=parse_count(reply_text),
-            has_media=has_media,
+            likes=parse_count(fields.get("likes")),
+            retweets=parse_count(fields.get("retweets")),
+            replies=parse_count(fields.get("replies")),
+            has_media=bool(fields.get("hasMedia")),
             url=f"https://x.com{tweet_url}" if tweet_url.startswith("/") else tweet_url,
-            quoted_tweet=quoted_tweet,
+            quoted_tweet=quoted_tweet_from_fields(fields),
             is_by_me=is_by_me,
             is_liked_by_me=is_liked_by_me,
             is_retweeted_by_me=is_retweeted_by_me,
@@ -384,25 +719,167 @@ async def extract_tweet_data(article, page: Page, my_handle: str | None = None)
         return None
 
 
-async def fetch_timeline(
-    count: int = 50,
-    headless: bool = True,
-    on_progress: callable = None,
-) -> tuple[list[Tweet], str | None]:
+def tweet_with_counts(tweet: Tweet, fields: dict) -> Tweet:
+    """Copy a known tweet with the engagement state from a known-id row."""
+    return replace(
+        tweet,
+        likes=parse_count(fields.get("likes")),
+        retweets=parse_count(fields.get("retweets")),
+        replies=parse_count(fields.get("replies")),
+        is_liked_by_me=bool(fields.get("likedByMe")),
+        is_retweeted_by_me=bool(fields.get("retweetedByMe")),
+    )
+
+
+async def extract_tweets(
+    page: Page,
+    my_handle: str | None = None,
+    skip_ids: Iterable[str] = (),
+    scroll: bool = False,
+    known: Mapping[str, Tweet] | None = None,
+) -> list[Tweet]:
+    """Extract tweets currently in the page, in document order.
+
+    Articles whose tweet id is in skip_ids are skipped in-page, before any
+    of their fields are read. Tweets in `known` (keyed by id) only have their
+    engagement counts read and are returned as updated copies. With
+    scroll=True the page is also scrolled down one viewport after reading,
+    in the same round-trip.
     """
-    Fetch tweets from the X home timeline using Chrome session.
+    rows = await page.evaluate(
+        EXTRACT_TWEETS_JS,
+        [EXTRACT_SELECTORS, list(skip_ids), scroll, list(known or ())],
+    )
+    return tweets_from_rows(rows, my_handle, known)
+
+
+def tweets_from_rows(
+    rows: list[dict | None],
+    my_handle: str | None = None,
+    known: Mapping[str, Tweet] | None = None,
+) -> list[Tweet]:
+    """Build Tweets from EXTRACT_TWEETS_JS rows, dropping skipped and invalid ones."""
+    my_handle_lower = my_handle.lower() if my_handle else None
+    tweets = []
+    for fields in rows:
+        if fields is None:
+            continue
+        if fields.get("known"):
+            tweet_id = fields["href"].split("/status/")[-1].split("?")[0]
+            tweets.append(tweet_with_counts(known[tweet_id], fields))
+            continue
+        tweet = tweet_from_fields(fields, my_handle_lower)
+        if tweet:
+            tweets.append(tweet)
+    return tweets
+
+
+async def _wait_for_new_tweets(page: Page, seen_ids: Iterable[str]) -> None:
+    """Wait out the pacing delay, and beyond it until unread tweets appear.
+
+    The two waits run together: when new tweets render within the pacing
+    delay this costs nothing extra; otherwise it waits up to
+    NEW_TWEETS_TIMEOUT for them before the next pass.
+    """
+    async def new_tweets() -> None:
+        try:
+            await page.wait_for_function(
+                NEW_TWEETS_JS,
+                arg=[EXTRACT_SELECTORS, list(seen_ids)],
+                timeout=NEW_TWEETS_TIMEOUT,
+                polling=100,
+            )
+        except Exception:
+            pass  # Nothing new in time; the idle-pass check handles it
+
+    await asyncio.gather(page.wait_for_timeout(_scroll_delay()), new_tweets())
+
+
+async def _iter_tweets(
+    page: Page,
+    count: int,
+    max_scrolls: int,
+    my_handle: str | None = None,
+    keep: Callable[[Tweet], bool] | None = None,
+    known: Mapping[str, Tweet] | None = None,
+) -> AsyncIterator[Tweet]:
+    """Scroll the current page, yielding each new tweet, up to `count` of them.
 
     Args:
-        count: Number of tweets to fetch
-        headless: Run browser in headless mode
-        on_progress: Callback function for progress updates
+        keep: Optional predicate; tweets it rejects are not yielded
+        known: Already-built tweets by id; only their counts are re-read
+    """
+    seen: set[str] = set()  # Every id read so far, kept or rejected
+    yielded = 0
+    scroll_count = 0
+    idle_scrolls = 0
+
+    while yielded < count and scroll_count < max_scrolls and idle_scrolls < IDLE_SCROLL_LIMIT:
+        # Reading and scrolling share one evaluate; then wait for new content
+        batch = await extract_tweets(page, my_handle, skip_ids=seen, scroll=True, known=known)
+        if batch:
+            idle_scrolls = 0
+        elif seen:
+            idle_scrolls += 1
+
+        for tweet in batch:
+            if yielded >= count:
+                break
+
+            if tweet.id not in seen:
+                seen.add(tweet.id)
+                if keep is None or keep(tweet):
+                    yielded += 1
+                    yield tweet
+
+        scroll_count += 1
+        # Finished: don't wait for content that won't be read
+        if (
+            yielded >= count
+            or scroll_count >= max_scrolls
+            or idle_scrolls >= IDLE_SCROLL_LIMIT
+        ):
+            break
+        await _wait_for_new_tweets(page, seen)
+
+
+async def _collect_tweets(
+    page: Page,
+    count: int,
+    max_scrolls: int,
+    my_handle: str | None = None,
+    keep: Callable[[Tweet], bool] | None = None,
+    on_progress: callable = None,
+    progress_tag: str | None = None,
+    known: Mapping[str, Tweet] | None = None,
+) -> dict[str, Tweet]:
+    """Scroll the current page collecting up to `count` tweets, keyed by id.
 
-    Returns:
-        Tuple of (List of Tweet objects, logged-in user handle or None)
+    Args:
+        keep: Optional predicate; tweets it rejects are not collected
+        progress_tag: If set, passed as the first on_progress argument
+        known: Already-built tweets by id; only their counts are re-read
     """
     tweets: dict[str, Tweet] = {}
-    my_handle: str | None = None
 
+    async for tweet in _iter_tweets(page, count, max_scrolls, my_handle, keep, known):
+        tweets[tweet.id] = tweet
+
+        if on_progress:
+            if progress_tag:
+                on_progress(progress_tag, len(tweets), count)
+            else:
+                on_progress(len(tweets), count)
+
+    return tweets
+
+
+@asynccontextmanager
+async def _home_timeline_page(headless: bool = True) -> AsyncIterator[tuple[Page, str | None]]:
+    """Open the home timeline in its own context on the shared browser.
+
+    Yields (page, logged-in user handle or None); the context is closed on exit.
+    """
     # Get session from Chrome
     cookies = get_x_session_from_chrome()
     if not cookies:
@@ -410,13 +887,12 @@ async def fetch_timeline(
             "Not logged into X. Please log in to x.com in Chrome first."
         )
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless)
-        context = await browser.new_context(
-            viewport={"width": 1280, "height": 800},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-
+    browser = await _get_browser(headless)
+    context = await browser.new_context(
+        viewport={"width": 1280, "height": 800},
+        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+    try:
         # Add cookies to the context
         await context.add_cookies(cookies)
 
@@ -432,41 +908,43 @@ async def fetch_timeline(
 
         # Check if we're logged in
         if "/login" in page.url or "x.com/i/flow/login" in page.url:
-            await browser.close()
+            forget_x_session()
             raise RuntimeError(
                 "Not logged in to X. Please log in to x.com in Chrome first, "
                 "then try again."
             )
 
         # Get the logged-in user's handle
-        my_handle = await get_logged_in_user(page)
-
-        # Scroll and collect tweets with variable timing
-        scroll_count = 0
-        max_scrolls = count // 5 + 10
+        yield page, await get_logged_in_user(page)
+    finally:
+        await context.close()
 
-        while len(tweets) < count and scroll_count < max_scrolls:
-            articles = await page.query_selector_all(TWEET_SELECTOR)
 
-            for article in articles:
-                if len(tweets) >= count:
-                    break
-
-                tweet = await extract_tweet_data(article, page, my_handle)
-                if tweet and tweet.id not in tweets:
-                    tweets[tweet.id] = tweet
-
-                    if on_progress:
-                        on_progress(len(tweets), count)
+async def fetch_timeline(
+    count: int = 50,
+    headless: bool = True,
+    on_progress: callable = None,
+) -> tuple[list[Tweet], str | None]:
+    """
+    Fetch tweets from the X home timeline using Chrome session.
 
-            await page.evaluate("window.scrollBy(0, window.innerHeight)")
-            await page.wait_for_timeout(_scroll_delay())
-            scroll_count += 1
+    Args:
+        count: Number of tweets to fetch
+        headless: Run browser in headless mode
+        on_progress: Callback function for progress updates
 
-        await browser.close()
+    Returns:
+        Tuple of (List of Tweet objects, logged-in user handle or None)
+    """
+    async with _home_timeline_page(headless) as (page, my_handle):
+        # Scroll and collect tweets with variable timing
+        tweets = await _collect_tweets(
+            page, count, count // 5 + 10, my_handle, on_progress=on_progress,
+            known=load_recent_cached_tweets(),
+        )
 
     _update_fetch_time()
-    return list(tweets.values())[:count], my_handle
+    return list(islice(tweets.values(), count)), my_handle
 
 
 async def fetch_since(
@@ -509,38 +987,29 @@ def parse_notification_text(text: str) -> tuple[NotificationType, list[str], int
     Returns:
         (notification_type, actor_names, additional_count)
     """
-    text_lower = text.lower()
-
-    # Determine notification type - check multiple patterns for each type
-    if any(p in text_lower for p in ["liked your", "likes your"]):
-        notif_type = NotificationType.LIKE
-    elif any(p in text_lower for p in ["retweeted your", "reposted your", "retweets your", "reposts your"]):
-        notif_type = NotificationType.RETWEET
-    elif any(p in text_lower for p in ["replied", "reply", "commented", "responding to"]):
-        notif_type = NotificationType.REPLY
-    elif any(p in text_lower for p in ["quoted your", "quotes your", "quote tweeted"]):
-        notif_type = NotificationType.QUOTE
-    elif any(p in text_lower for p in ["followed you", "follows you", "started following"]):
-        notif_type = NotificationType.FOLLOW
-    elif any(p in text_lower for p in ["mentioned you", "mentions you", "tagged you"]):
-        notif_type = NotificationType.MENTION
-    else:
-        notif_type = NotificationType.UNKNOWN
+    # Determine notification type - one scan for every phrase, then keep the
+    # highest-priority type among the phrases found
+    notif_type = NotificationType.UNKNOWN
+    best = len(NOTIFICATION_TYPE_PHRASES)
+    for phrase in NOTIFICATION_TYPE_PATTERN.findall(text):
+        priority, phrase_type = NOTIFICATION_TYPE_BY_PHRASE[phrase.lower()]
+        if priority < best:
+            best, notif_type = priority, phrase_type
 
     # Parse "and N others" pattern
     additional_count = 0
-    others_match = re.search(r"and (\d+) others?", text_lower)
+    others_match = OTHERS_COUNT_PATTERN.search(text)
     if others_match:
         additional_count = int(others_match.group(1))
 
     return notif_type, [], additional_count
 
 
-async def extract_notification_data(article, page: Page) -> Notification | None:
-    """Extract notification data from an article element."""
+def notification_from_fields(fields: dict) -> Notification | None:
+    """Build a Notification from the fields EXTRACT_NOTIFICATIONS_JS returns."""
     try:
         # Get the full text
-        text = await article.inner_text()
+        text = fields.get("text")
         if not text:
             return None
 
@@ -550,16 +1019,13 @@ async def extract_notification_data(article, page: Page) -> Notification | None:
         # They just won't count toward engagement stats
 
         # Get user links (actors who performed the action)
-        links = await article.query_selector_all('a[role="link"]')
         actor_handle = "@unknown"
         actor_name = "Unknown"
         additional_actors = []
 
-        for link in links:
-            href = await link.get_attribute("href") or ""
+        for href, link_text in fields.get("links", []):
             # Skip non-user links (like status links)
             if href.startswith("/") and "/status/" not in href and len(href) > 1:
-                link_text = await link.inner_text()
                 handle = f"@{href.strip('/')}"
 
                 if actor_handle == "@unknown":
@@ -569,19 +1035,17 @@ async def extract_notification_data(article, page: Page) -> Notification | None:
                     additional_actors.append(handle)
 
         # Get timestamp - convert to local time for consistent comparison
-        time_elem = await article.query_selector("time")
-        if time_elem:
-            time_str = await time_elem.get_attribute("datetime")
-            if time_str:
-                # Parse ISO timestamp (usually UTC) and convert to local naive datetime
-                from datetime import timezone
-                utc_dt = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-                # Convert to local time, then make naive for comparison with datetime.now()
-                local_dt = utc_dt.astimezone().replace(tzinfo=None)
-                timestamp = local_dt
+        time_str = fields.get("time")
+        if time_str:
+            # Parse ISO timestamp (usually UTC) and convert to local naive datetime
+            if time_str.endswith("Z"):
+                utc_dt = datetime.fromisoformat(time_str[:-1]).replace(tzinfo=timezone.utc)
             else:
-                time_text = await time_elem.inner_text()
-                timestamp = parse_relative_time(time_text)
+                utc_dt = datetime.fromisoformat(time_str)
+            # Convert to local time, then make naive for comparison with datetime.now()
+            timestamp = utc_dt.astimezone().replace(tzinfo=None)
+        elif fields.get("timeText") is not None:
+            timestamp = parse_relative_time(fields["timeText"])
         else:
             timestamp = datetime.now()
 
@@ -591,16 +1055,16 @@ async def extract_notification_data(article, page: Page) -> Notification | None:
         reply_to_content = None
 
         # X uses [data-testid="tweetText"] for tweet content
-        tweet_text_elements = await article.query_selector_all('[data-testid="tweetText"]')
+        tweet_texts = fields.get("tweetTexts", [])
 
         if notif_type == NotificationType.REPLY:
             # For replies: first tweetText is original, second is the reply
-            if len(tweet_text_elements) >= 2:
-                reply_to_content = (await tweet_text_elements[0].inner_text())[:200]
-                reply_content = (await tweet_text_elements[1].inner_text())[:200]
-            elif len(tweet_text_elements) == 1:
+            if len(tweet_texts) >= 2:
+                reply_to_content = tweet_texts[0][:200]
+                reply_content = tweet_texts[1][:200]
+            elif len(tweet_texts) == 1:
                 # Only one text element - could be either, assume it's the reply
-                reply_content = (await tweet_text_elements[0].inner_text())[:200]
+                reply_content = tweet_texts[0][:200]
             else:
                 # Fallback to text parsing if no tweetText elements found
                 lines = text.split("\n")
@@ -612,8 +1076,8 @@ async def extract_notification_data(article, page: Page) -> Notification | None:
                     reply_content = content_lines[0][:200]
         else:
             # For other notification types, get any tweet preview
-            if tweet_text_elements:
-                tweet_preview = (await tweet_text_elements[0].inner_text())[:100]
+            if tweet_texts:
+                tweet_preview = tweet_texts[0][:100]
             else:
                 # Fallback to text parsing
                 lines = text.split("\n")
@@ -636,6 +1100,69 @@ async def extract_notification_data(article, page: Page) -> Notification | None:
         return None
 
 
+async def extract_notification_fields(
+    page: Page, skip_keys: Iterable[str] = (), scroll: bool = False
+) -> list[dict]:
+    """Extract the raw fields of notification articles in the page.
+
+    Articles whose dedup key (the "key" field: first link, timestamp and
+    leading text) is in skip_keys are left out.
+    With scroll=True the page is scrolled down one viewport after reading.
+    """
+    rows = await page.evaluate(
+        EXTRACT_NOTIFICATIONS_JS, [EXTRACT_SELECTORS, list(skip_keys), scroll]
+    )
+    return [fields for fields in rows if fields is not None]
+
+
+async def _collect_notifications(
+    page: Page,
+    count: int,
+    max_scrolls: int,
+    on_progress: callable = None,
+    progress_tag: str | None = None,
+) -> list[Notification]:
+    """Scroll the current page collecting up to `count` notifications.
+
+    Args:
+        progress_tag: If set, passed as the first on_progress argument
+    """
+    notifications: list[Notification] = []
+    scroll_count = 0
+    idle_scrolls = 0
+    seen_keys = set()
+
+    while len(notifications) < count and scroll_count < max_scrolls and idle_scrolls < IDLE_SCROLL_LIMIT:
+        batch = await extract_notification_fields(page, skip_keys=seen_keys, scroll=True)
+        if batch:
+            idle_scrolls = 0
+        elif seen_keys:
+            idle_scrolls += 1
+
+        for fields in batch:
+            if len(notifications) >= count:
+                break
+
+            key = fields["key"]
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+
+            notif = notification_from_fields(fields)
+            if notif:
+                notifications.append(notif)
+                if on_progress:
+                    if progress_tag:
+                        on_progress(progress_tag, len(notifications), count)
+                    else:
+                        on_progress(len(notifications), count)
+
+        await page.wait_for_timeout(_scroll_delay())
+        scroll_count += 1
+
+    return notifications
+
+
 async def fetch_notifications(
     count: int = 50,
     headless: bool = True,
@@ -658,15 +1185,8 @@ async def fetch_notifications(
     if not cookies:
         raise RuntimeError("Not logged into X. Please log in to x.com in Chrome first.")
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless)
-        context = await browser.new_context(
-            viewport={"width": 1280, "height": 800},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        )
-        await context.add_cookies(cookies)
-        page = await context.new_page()
-
+    page = await _new_session_page(await _get_browser(headless), cookies)
+    try:
         # Block unnecessary resources for faster loading
         # Resource blocking disabled - was causing blank pages on X
         # await page.route("**/*", _block_unnecessary_resources)
@@ -676,39 +1196,15 @@ async def fetch_notifications(
 
         # Check if logged in
         if "/login" in page.url:
-            await browser.close()
+            forget_x_session()
             raise RuntimeError("Not logged in to X.")
 
         # Scroll and collect notifications with variable timing
-        scroll_count = 0
-        max_scrolls = count // 5 + 5
-        seen_ids = set()
-
-        while len(notifications) < count and scroll_count < max_scrolls:
-            articles = await page.query_selector_all("article")
-
-            for article in articles:
-                if len(notifications) >= count:
-                    break
-
-                # Use inner text as a simple dedup key
-                text = await article.inner_text()
-                text_key = text[:100] if text else ""
-                if text_key in seen_ids:
-                    continue
-                seen_ids.add(text_key)
-
-                notif = await extract_notification_data(article, page)
-                if notif:
-                    notifications.append(notif)
-                    if on_progress:
-                        on_progress(len(notifications), count)
-
-            await page.evaluate("window.scrollBy(0, window.innerHeight)")
-            await page.wait_for_timeout(_scroll_delay())
-            scroll_count += 1
-
-        await browser.close()
+        notifications = await _collect_notifications(
+            page, count, count // 5 + 5, on_progress=on_progress
+        )
+    finally:
+        await page.context.close()
 
     _update_fetch_time()
     return notifications[:count]
@@ -739,15 +1235,8 @@ async def fetch_profile_timeline(
     if not cookies:
         raise RuntimeError("Not logged into X. Please log in to x.com in Chrome first.")
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless)
-        context = await browser.new_context(
-            viewport={"width": 1280, "height": 800},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        )
-        await context.add_cookies(cookies)
-        page = await context.new_page()
-
+    page = await _new_session_page(await _get_browser(headless), cookies)
+    try:
         # Block unnecessary resources for faster loading
         # Resource blocking disabled - was causing blank pages on X
         # await page.route("**/*", _block_unnecessary_resources)
@@ -757,38 +1246,37 @@ async def fetch_profile_timeline(
 
         # Check if logged in
         if "/login" in page.url:
-            await browser.close()
+            forget_x_session()
             raise RuntimeError("Not logged in to X.")
 
         my_handle = f"@{username}"
+        my_handle_lower = my_handle.lower()
 
         # Scroll and collect tweets with variable timing
-        scroll_count = 0
-        max_scrolls = count // 5 + 5
-
-        while len(tweets) < count and scroll_count < max_scrolls:
-            articles = await page.query_selector_all(TWEET_SELECTOR)
-
-            for article in articles:
-                if len(tweets) >= count:
-                    break
-
-                tweet = await extract_tweet_data(article, page, my_handle)
-                # Only include tweets by this user (not retweets or replies shown on profile)
-                if tweet and tweet.id not in tweets and tweet.author_handle.lower() == my_handle.lower():
-                    tweets[tweet.id] = tweet
-
-                    if on_progress:
-                        on_progress(len(tweets), count)
+        # Only include tweets by this user (not retweets or replies shown on profile)
+        tweets = await _collect_tweets(
+            page,
+            count,
+            count // 5 + 5,
+            my_handle,
+            keep=lambda tweet: tweet.author_handle.lower() == my_handle_lower,
+            on_progress=on_progress,
+        )
+    finally:
+        await page.context.close()
 
-            await page.evaluate("window.scrollBy(0, window.innerHeight)")
-            await page.wait_for_timeout(_scroll_delay())
-            scroll_count += 1
+    _update_fetch_time()
+    return list(islice(tweets.values(), count))
 
-        await browser.close()
 
-    _update_fetch_time()
-    return list(tweets.values())[:count]
+async def _new_session_page(browser, cookies: list[dict]) -> Page:
+    """Open a page in a new browser context carrying the X session cookies."""
+    context = await browser.new_context(
+        viewport={"width": 1280, "height": 800},
+        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+    )
+    await context.add_cookies(cookies)
+    return await context.new_page()
 
 
 async def fetch_all_engagement(
@@ -800,33 +1288,27 @@ async def fetch_all_engagement(
 ) -> tuple[list[Tweet], list[Tweet], list[Notification], str | None]:
     """
     Fetch home timeline, profile timeline, and notifications in a single session.
-    Uses variable delays between actions for reliability.
+
+    The home page is loaded first to find the logged-in user; the three
+    scrapes then run concurrently, each in its own browser context, with
+    the usual variable delays inside each one.
 
     Returns:
         (home_tweets, profile_tweets, notifications, my_handle)
     """
-    home_tweets: dict[str, Tweet] = {}
-    profile_tweets: dict[str, Tweet] = {}
-    notifications: list[Notification] = []
     my_handle: str | None = None
 
     cookies = get_x_session_from_chrome()
     if not cookies:
         raise RuntimeError("Not logged into X. Please log in to x.com in Chrome first.")
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless)
-        context = await browser.new_context(
-            viewport={"width": 1280, "height": 800},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        )
-        await context.add_cookies(cookies)
-        page = await context.new_page()
-
+    browser = await _get_browser(headless)
+    page = await _new_session_page(browser, cookies)
+    try:
         # NOTE: Resource blocking disabled - was causing blank pages
         # await page.route("**/*", _block_unnecessary_resources)
 
-        # 1. Fetch home timeline
+        # 1. Load home timeline
         if on_progress:
             on_progress("home", 0, home_count)
 
@@ -841,97 +1323,87 @@ async def fetch_all_engagement(
             pass
 
         if "/login" in page.url:
-            await browser.close()
+            forget_x_session()
             raise RuntimeError("Not logged in to X.")
 
         my_handle = await get_logged_in_user(page)
 
-        scroll_count = 0
-        while len(home_tweets) < home_count and scroll_count < home_count // 5 + 5:
-            articles = await page.query_selector_all(TWEET_SELECTOR)
-            for article in articles:
-                if len(home_tweets) >= home_count:
-                    break
-                tweet = await extract_tweet_data(article, page, my_handle)
-                if tweet and tweet.id not in home_tweets:
-                    home_tweets[tweet.id] = tweet
-                    if on_progress:
-                        on_progress("home", len(home_tweets), home_count)
-
-            await page.evaluate("window.scrollBy(0, window.innerHeight)")
-            await page.wait_for_timeout(_scroll_delay())
-            scroll_count += 1
+        async def collect_profile() -> dict[str, Tweet]:
+            # 2. Profile timeline, in its own context
+            if not my_handle or profile_count <= 0:
+                return {}
 
-        # 2. Fetch profile timeline (with navigation pause)
-        if my_handle and profile_count > 0:
-            # Pause before navigating like a human would
-            await page.wait_for_timeout(_nav_delay())
-
-            if on_progress:
-                on_progress("profile", 0, profile_count)
-
-            username = my_handle.lstrip("@")
-            await page.goto(f"https://x.com/{username}", wait_until="domcontentloaded", timeout=60000)
-            await page.wait_for_timeout(_page_load_delay())
-
-            scroll_count = 0
-            while len(profile_tweets) < profile_count and scroll_count < profile_count // 5 + 5:
-                articles = await page.query_selector_all(TWEET_SELECTOR)
-                for article in articles:
-                    if len(profile_tweets) >= profile_count:
-                        break
-                    tweet = await extract_tweet_data(article, page, my_handle)
-                    if tweet and tweet.id not in profile_tweets:
-                        if tweet.author_handle.lower() == my_handle.lower():
-                            profile_tweets[tweet.id] = tweet
-                            if on_progress:
-                                on_progress("profile", len(profile_tweets), profile_count)
-
-                await page.evaluate("window.scrollBy(0, window.innerHeight)")
-                await page.wait_for_timeout(_scroll_delay())
-                scroll_count += 1
-
-        # 3. Fetch notifications (with navigation pause)
-        if notifications_count > 0:
-            # Pause before navigating like a human would
-            await page.wait_for_timeout(_nav_delay())
-
-            if on_progress:
-                on_progress("notifications", 0, notifications_count)
-
-            await page.goto("https://x.com/notifications", wait_until="domcontentloaded", timeout=60000)
-            await page.wait_for_timeout(_page_load_delay())
-
-            scroll_count = 0
-            seen_ids = set()
-            while len(notifications) < notifications_count and scroll_count < notifications_count // 5 + 5:
-                articles = await page.query_selector_all("article")
-                for article in articles:
-                    if len(notifications) >= notifications_count:
-                        break
-
-                    text = await article.inner_text()
-                    text_key = text[:100] if text else ""
-                    if text_key in seen_ids:
-                        continue
-                    seen_ids.add(text_key)
-
-                    notif = await extract_notification_data(article, page)
-                    if notif:
-                        notifications.append(notif)
-                        if on_progress:
-                            on_progress("notifications", len(notifications), notifications_count)
-
-                await page.evaluate("window.scrollBy(0, window.innerHeight)")
-                await page.wait_for_timeout(_scroll_delay())
-                scroll_count += 1
-
-        await browser.close()
+            profile_page = await _new_session_page(browser, cookies)
+            try:
+                # Pause before navigating like a human would
+                await profile_page.wait_for_timeout(_nav_delay())
+
+                if on_progress:
+                    on_progress("profile", 0, profile_count)
+
+                username = my_handle.lstrip("@")
+                my_handle_lower = my_handle.lower()
+                await profile_page.goto(f"https://x.com/{username}", wait_until="domcontentloaded", timeout=60000)
+                await profile_page.wait_for_timeout(_page_load_delay())
+
+                return await _collect_tweets(
+                    profile_page,
+                    profile_count,
+                    profile_count // 5 + 5,
+                    my_handle,
+                    keep=lambda tweet: tweet.author_handle.lower() == my_handle_lower,
+                    on_progress=on_progress,
+                    progress_tag="profile",
+                )
+            finally:
+                await profile_page.context.close()
+
+        async def collect_notifications() -> list[Notification]:
+            # 3. Notifications, in its own context
+            if notifications_count <= 0:
+                return []
+
+            notifications_page = await _new_session_page(browser, cookies)
+            try:
+                # Pause before navigating like a human would
+                await notifications_page.wait_for_timeout(_nav_delay())
+
+                if on_progress:
+                    on_progress("notifications", 0, notifications_count)
+
+                await notifications_page.goto("https://x.com/notifications", wait_until="domcontentloaded", timeout=60000)
+                await notifications_page.wait_for_timeout(_page_load_delay())
+
+                return await _collect_notifications(
+                    notifications_page,
+                    notifications_count,
+                    notifications_count // 5 + 5,
+                    on_progress=on_progress,
+                    progress_tag="notifications",
+                )
+            finally:
+                await notifications_page.context.close()
+
+        home_tweets, profile_tweets, notifications = await asyncio.gather(
+            _collect_tweets(
+                page,
+                home_count,
+                home_count // 5 + 5,
+                my_handle,
+                on_progress=on_progress,
+                progress_tag="home",
+                known=load_recent_cached_tweets(),
+            ),
+            collect_profile(),
+            collect_notifications(),
+        )
+    finally:
+        await page.context.close()
 
     _update_fetch_time()
     return (
-        list(home_tweets.values())[:home_count],
-        list(profile_tweets.values())[:profile_count],
+        list(islice(home_tweets.values(), home_count)),
+        list(islice(profile_tweets.values(), profile_count)),
         notifications[:notifications_count],
         my_handle,
     )
@@ -972,90 +1444,83 @@ async def fetch_thread(
     if not cookies:
         return None
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless)
-        context = await browser.new_context(
-            viewport={"width": 1280, "height": 800},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        )
-        await context.add_cookies(cookies)
-        page = await context.new_page()
+    page = await _new_session_page(await _get_browser(headless), cookies)
+    try:
+        # Navigate to tweet detail page
+        await page.goto(tweet_url, wait_until="domcontentloaded", timeout=30000)
+        await page.wait_for_timeout(_page_load_delay())
 
+        # Wait for tweets to load
         try:
-            # Navigate to tweet detail page
-            await page.goto(tweet_url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(_page_load_delay())
+            await page.wait_for_selector(TWEET_SELECTOR, timeout=10000)
+        except Exception:
+            return None
 
-            # Wait for tweets to load
-            try:
-                await page.wait_for_selector(TWEET_SELECTOR, timeout=10000)
-            except Exception:
-                await browser.close()
-                return None
-
-            # Get logged-in user for engagement detection
-            my_handle = await get_logged_in_user(page)
-
-            # Collect all tweets on the page
-            parent_tweets: list[Tweet] = []
-            reply_tweets: list[Tweet] = []
-            original_tweet: Tweet | None = None
-
-            # First pass: collect all visible tweets
-            articles = await page.query_selector_all(TWEET_SELECTOR)
-
-            found_original = False
-            for article in articles:
-                tweet = await extract_tweet_data(article, page, my_handle)
-                if not tweet:
-                    continue
+        # Get logged-in user for engagement detection, reading the visible
+        # tweets concurrently; is_by_me is filled in once the handle is known
+        my_handle, first_tweets = await asyncio.gather(
+            get_logged_in_user(page),
+            extract_tweets(page),
+        )
+        my_handle_lower = my_handle.lower() if my_handle else None
+
+        # Collect all tweets on the page
+        parent_tweets: list[Tweet] = []
+        reply_tweets: list[Tweet] = []
+        original_tweet: Tweet | None = None
+
+        # First pass: collect all visible tweets. Every id read is remembered
+        # so later passes skip it in-page - including parents, which would
+        # otherwise come back as "replies" after scrolling.
+        found_original = False
+        seen: set[str] = set()
+        for tweet in first_tweets:
+            seen.add(tweet.id)
+            tweet.is_by_me = (
+                my_handle_lower is not None
+                and tweet.author_handle.lower() == my_handle_lower
+            )
+            # Check if this is the target tweet
+            if tweet.id == target_tweet_id:
+                original_tweet = tweet
+                found_original = True
+            elif not found_original:
+                # Before target = parent/context
+                if len(parent_tweets) < max_parents:
+                    parent_tweets.append(tweet)
+            else:
+                # After target = replies
+                if len(reply_tweets) < max_replies:
+                    reply_tweets.append(tweet)
 
-                # Check if this is the target tweet
-                if tweet.id == target_tweet_id:
-                    original_tweet = tweet
-                    found_original = True
-                elif not found_original:
-                    # Before target = parent/context
-                    if len(parent_tweets) < max_parents:
-                        parent_tweets.append(tweet)
-                else:
-                    # After target = replies
-                    if len(reply_tweets) < max_replies:
-                        reply_tweets.append(tweet)
-
-            # If we didn't find the original tweet, something went wrong
-            if not original_tweet:
-                await browser.close()
-                return None
-
-            # Scroll down to get more replies if needed
-            scroll_count = 0
-            max_scrolls = 3
-            while len(reply_tweets) < max_replies and scroll_count < max_scrolls:
-                await page.evaluate("window.scrollBy(0, window.innerHeight)")
-                await page.wait_for_timeout(_scroll_delay())
-                scroll_count += 1
-
-                articles = await page.query_selector_all(TWEET_SELECTOR)
-                for article in articles:
-                    tweet = await extract_tweet_data(article, page, my_handle)
-                    if not tweet or tweet.id == target_tweet_id:
-                        continue
-
-                    # Check if we already have this tweet
-                    existing_ids = {t.id for t in reply_tweets}
-                    if tweet.id not in existing_ids and len(reply_tweets) < max_replies:
-                        # Only add tweets that appear after our target (replies)
-                        reply_tweets.append(tweet)
+        # If we didn't find the original tweet, something went wrong
+        if not original_tweet:
+            return None
 
-            await browser.close()
+        # Scroll down to get more replies if needed
+        scroll_count = 0
+        max_scrolls = 3
+        while len(reply_tweets) < max_replies and scroll_count < max_scrolls:
+            await _scroll_and_wait(page)
+            scroll_count += 1
 
-            return ThreadContext(
-                original_tweet=original_tweet,
-                parent_tweets=parent_tweets,
-                reply_tweets=reply_tweets,
-            )
+            for tweet in await extract_tweets(page, my_handle, skip_ids=seen):
+                # Check if we already have this tweet
+                if tweet.id in seen:
+                    continue
+                seen.add(tweet.id)
 
-        except Exception:
-            await browser.close()
-            return None
+                if len(reply_tweets) < max_replies:
+                    # Only add tweets that appear after our target (replies)
+                    reply_tweets.append(tweet)
+
+        return ThreadContext(
+            original_tweet=original_tweet,
+            parent_tweets=parent_tweets,
+            reply_tweets=reply_tweets,
+        )
+
+    except Exception:
+        return None
+    finally:
+        await page.context.close()
@@ -9,12 +9,16 @@ import anthropic
 
 from xfeed.config import get_api_key, load_config, load_objectives
 from xfeed.models import Tweet, FilteredTweet
-from xfeed.reputation import get_author_db
+from xfeed.reputation import RepParams, get_author_db
 
 
-# Track recently seen exploration authors to avoid repetition
+# Track recently seen exploration authors to avoid repetition; ordered by
+# when each was last seen, oldest first
 _exploration_author_cache: dict[str, datetime] = {}
 
+# Matches the outermost JSON array in a model response
+JSON_ARRAY_PATTERN = re.compile(r'\[[\s\S]*\]')
+
 
 SYSTEM_PROMPT = """You are a tweet relevance filter. Your job is to score tweets based on how relevant they are to the user's interests and objectives.
 
@@ -109,7 +113,7 @@ def format_tweets_for_prompt(tweets: list[Tweet]) -> str:
 def parse_filter_response(response_text: str) -> list[dict]:
     """Parse the JSON response from the model."""
     # Try to extract JSON from the response
-    json_match = re.search(r'\[[\s\S]*\]', response_text)
+    json_match = JSON_ARRAY_PATTERN.search(response_text)
     if json_match:
         try:
             return json.loads(json_match.group())
@@ -134,13 +138,18 @@ def _is_author_in_cooldown(author_handle: str, cooldown_hours: int) -> bool:
 
 def _mark_author_seen(author_handle: str) -> None:
     """Mark an exploration author as recently seen."""
-    global _exploration_author_cache
-    _exploration_author_cache[author_handle] = datetime.now()
-    # Clean up old entries
-    cutoff = datetime.now() - timedelta(hours=48)
-    _exploration_author_cache = {
-        k: v for k, v in _exploration_author_cache.items() if v > cutoff
-    }
+    now = datetime.now()
+    # Re-insert at the end, so the cache stays ordered oldest to newest
+    _exploration_author_cache.pop(author_handle, None)
+    _exploration_author_cache[author_handle] = now
+    # Clean up old entries from the oldest end, stopping at the first recent
+    # one (the entry just added always is), instead of rebuilding the cache
+    cutoff = now - timedelta(hours=48)
+    while True:
+        oldest = next(iter(_exploration_author_cache))
+        if _exploration_author_cache[oldest] > cutoff:
+            break
+        del _exploration_author_cache[oldest]
 
 
 def _build_explanation(factors: list[str], base_reason: str) -> str:
@@ -210,6 +219,7 @@ def filter_tweets(
     # Reputation settings
     reputation_enabled = config.get("reputation_boost_enabled", True)
     author_db = get_author_db() if reputation_enabled else None
+    rep_params = RepParams.from_config(config)
 
     client = anthropic.Anthropic(api_key=api_key)
 
@@ -260,7 +270,7 @@ def filter_tweets(
             on_progress(processed, len(tweets))
 
     # Process all scored tweets with enhanced scoring
-    filtered_tweets: list[FilteredTweet] = []
+    enhanced: list[tuple[dict, int, str]] = []
 
     for scored in all_scored:
         factors = scored["factors"]
@@ -284,21 +294,25 @@ def filter_tweets(
         if scored["is_unknown_author"] and score >= exploration_min_quality:
             explanation = f"[NEW] {explanation}"
 
+        enhanced.append((scored, score, explanation))
+
+    # Record scores in reputation DB (always, for tracking) in one transaction
+    if author_db:
+        author_db.record_tweet_scores([
+            (scored["tweet"].author_handle, scored["tweet"].author, score, scored["tweet"].id)
+            for scored, score, _ in enhanced
+        ])
+
+    filtered_tweets: list[FilteredTweet] = []
+
+    for scored, score, explanation in enhanced:
         tweet = scored["tweet"]
 
-        # Record score in reputation DB (always, for tracking)
         if author_db:
-            author_db.record_tweet_score(
-                author_handle=tweet.author_handle,
-                display_name=tweet.author,
-                score=score,
-                tweet_id=tweet.id,
-            )
-
             # Apply reputation boost for trusted authors
-            author_stats = author_db.get_author_stats(tweet.author_handle, config)
+            author_stats = author_db.get_author_stats(tweet.author_handle, rep_params)
             if author_stats:
-                boost = author_stats.reputation_boost(config)
+                boost = author_stats.reputation_boost(rep_params)
                 if boost > 0:
                     score = min(10, score + boost)
                     explanation += f" [rep+{boost:.1f}]"
@@ -309,7 +323,7 @@ def filter_tweets(
         # Apply threshold filter (same as before)
         if score >= threshold:
             filtered_tweets.append(FilteredTweet(
-                tweet=scored["tweet"],
+                tweet=tweet,
                 relevance_score=score,
                 reason=explanation,
                 is_superdunk=scored["superdunk"],
@@ -21,6 +21,16 @@ from rich import box
 from xfeed.models import FilteredTweet, TopicVibe, MyEngagementStats, Notification, NotificationType, ThreadContext, Tweet, Digest, DigestTopic, LinkSummary
 
 
+# Pre-processed keys from KeyboardListener._listen() -> names used by the UI
+_KEY_NAMES = {
+    'KEY_UP': 'up',
+    'KEY_DOWN': 'down',
+    'KEY_LEFT': 'left',
+    'KEY_RIGHT': 'right',
+    'KEY_ESCAPE': 'escape',
+}
+
+
 class KeyboardListener:
     """Non-blocking keyboard listener for terminal using select()."""
 
@@ -107,13 +117,18 @@ class KeyboardListener:
             return None
 
     def drain_keys(self) -> list[str]:
-        """Get all queued keypresses, non-blocking."""
+        """Get all queued keypresses, non-blocking.
+
+        Arrow/escape sequences are mapped to the same names returned by
+        get_key_with_escape_sequence().
+        """
         keys = []
         while True:
             try:
-                keys.append(self.queue.get_nowait())
+                key = self.queue.get_nowait()
             except Empty:
                 break
+            keys.append(_KEY_NAMES.get(key, key))
         return keys
 
     def get_key_with_escape_sequence(self, timeout: float = 0.15) -> str | None:
@@ -132,18 +147,7 @@ class KeyboardListener:
             return None
 
         # Map pre-processed keys from _listen() to expected names
-        if key == 'KEY_UP':
-            return 'up'
-        elif key == 'KEY_DOWN':
-            return 'down'
-        elif key == 'KEY_LEFT':
-            return 'left'
-        elif key == 'KEY_RIGHT':
-            return 'right'
-        elif key == 'KEY_ESCAPE':
-            return 'escape'
-
-        return key
+        return _KEY_NAMES.get(key, key)
 
 
 def normalize_emoji(emoji: str) -> tuple[str, int]:
@@ -676,7 +680,7 @@ class EngagementCard:
         )
 
 
-def compute_engagement_stats(
+async def compute_engagement_stats(
     tweets: list[FilteredTweet],
     my_handle: str | None,
     notifications: list[Notification] | None = None,
@@ -711,7 +715,7 @@ def compute_engagement_stats(
         # Analyze reply tones
         if analyze_tones:
             from xfeed.tone import analyze_reply_tones
-            notifications = analyze_reply_tones(notifications)
+            notifications = await analyze_reply_tones(notifications)
 
         stats.recent_notifications = notifications[:20]  # Keep top 20 for paging
 
@@ -1725,17 +1729,6 @@ def get_insight(vibes: list[TopicVibe], tweets: list[FilteredTweet]) -> str:
     return "No tweets"
 
 
-def parse_fetch_result(result, default_handle=None):
-    """Parse fetch result which can be 2-tuple or 4-tuple."""
-    if not isinstance(result, tuple):
-        return result, default_handle, [], []
-    if len(result) == 2:
-        return result[0], result[1], [], []
-    if len(result) == 4:
-        return result
-    return result[0], default_handle, [], []
-
-
 async def run_mosaic(
     fetch_func,
     vibe_func=None,
@@ -1744,7 +1737,12 @@ async def run_mosaic(
     threshold: int = 5,
     skip_cache: bool = False,
 ):
-    """Run the mosaic display with periodic refresh."""
+    """Run the mosaic display with periodic refresh.
+
+    fetch_func(count, threshold) must return a 4-tuple of
+    (filtered_tweets, my_handle, profile_tweets, notifications).
+    vibe_func(filtered_tweets), if given, is awaited for a list of TopicVibe.
+    """
     console = Console()
 
     # Create mosaic immediately with empty state (shows loading screen)
@@ -1820,26 +1818,24 @@ async def run_mosaic(
     async def do_initial_load():
         """Perform initial load with phase updates."""
         nonlocal my_handle
-        loop = asyncio.get_event_loop()
 
         # Phase 1: Fetch from X and score with Claude Haiku
         mosaic.load_phase = "Fetching & scoring tweets..."
         mosaic.load_start_time = time.time()  # Reset timer for this phase
-        result = await fetch_func(count, threshold)
-        tweets, my_handle, profile_tweets, notifications = parse_fetch_result(result)
+        tweets, my_handle, profile_tweets, notifications = await fetch_func(count, threshold)
 
-        # Phase 2: Extract vibes/topics (run in executor to not block UI)
+        # Phase 2: Extract vibes/topics (async API call, UI keeps running)
         vibes = []
         if tweets and vibe_func:
             mosaic.load_phase = "Extracting vibes..."
             mosaic.load_start_time = time.time()  # Reset timer for this phase
-            vibes = await loop.run_in_executor(None, vibe_func, tweets)
+            vibes = await vibe_func(tweets)
 
         # Phase 3: Build display (fast)
         mosaic.load_phase = "Building mosaic..."
 
         # Compute engagement stats
-        engagement_stats = compute_engagement_stats(
+        engagement_stats = await compute_engagement_stats(
             tweets, my_handle, notifications, profile_tweets
         ) if tweets else None
 
@@ -1936,19 +1932,17 @@ async def run_mosaic(
                     # Check if background refresh completed (but vibe extraction still pending)
                     if refresh_task is not None and refresh_task.done() and vibe_task is None:
                         try:
-                            result = refresh_task.result()
-                            new_tweets, new_handle, new_profile, new_notifs = parse_fetch_result(result, my_handle)
+                            new_tweets, new_handle, new_profile, new_notifs = refresh_task.result()
 
                             # Start vibe extraction in background
                             if vibe_func and new_tweets:
                                 mosaic.refresh_phase = "extracting vibes"
-                                loop = asyncio.get_event_loop()
-                                vibe_task = loop.run_in_executor(None, vibe_func, new_tweets)
+                                vibe_task = asyncio.create_task(vibe_func(new_tweets))
                                 vibe_task_data = (new_tweets, new_handle, new_profile, new_notifs)
                             else:
                                 # No vibes needed, finish refresh now
                                 # Always compute engagement stats (even without tweets, we have notifications)
-                                new_stats = compute_engagement_stats(
+                                new_stats = await compute_engagement_stats(
                                     new_tweets, new_handle, new_notifs, new_profile
                                 )
                                 mosaic.update_tweets(new_tweets, [], new_stats)
@@ -1975,7 +1969,7 @@ async def run_mosaic(
                             new_tweets, new_handle, new_profile, new_notifs = vibe_task_data
 
                             # Always compute engagement stats (notifications provide engagement data)
-                            new_stats = compute_engagement_stats(
+                            new_stats = await compute_engagement_stats(
                                 new_tweets, new_handle, new_notifs, new_profile
                             )
                             mosaic.update_tweets(new_tweets, new_vibes, new_stats)
@@ -2059,15 +2053,18 @@ async def run_mosaic(
                     # Handle keyboard input - process keys with proper escape sequence handling
                     should_quit = False
                     should_refresh = False
+                    should_edit = False
 
-                    # Process all available keys
-                    while True:
-                        key = keyboard.get_key_with_escape_sequence()
-                        if key is None:
-                            break
+                    # Hot state read/written per key lives in locals; written back once below
+                    overlay_visible = mosaic.thread_overlay_visible
+                    thread_loading = mosaic.thread_loading
+                    selected_num = mosaic.selected_tweet_num
+                    threshold_now = mosaic.threshold
 
+                    # Process all available keys
+                    for key in keyboard.drain_keys():
                         # Handle overlay mode with full navigation
-                        if mosaic.thread_overlay_visible:
+                        if overlay_visible:
                             if key == 'up':
                                 # Move selection up
                                 if mosaic.thread_selected_index > -1:
@@ -2099,8 +2096,8 @@ async def run_mosaic(
                                                 thread_task = asyncio.create_task(fetch_thread(selected_reply.url))
                                         else:
                                             # Not cached - show loading and fetch
-                                            mosaic.thread_loading = True
-                                            mosaic.thread_overlay_visible = False
+                                            thread_loading = True
+                                            overlay_visible = False
                                             mosaic.thread_fetch_url = selected_reply.url
                                             thread_task = asyncio.create_task(fetch_thread(selected_reply.url))
                             elif key == 'escape' or key == 'left':
@@ -2111,7 +2108,7 @@ async def run_mosaic(
                                     mosaic.thread_selected_index = -1
                                 else:
                                     # Close overlay entirely
-                                    mosaic.thread_overlay_visible = False
+                                    overlay_visible = False
                                     mosaic.thread_context = None
                                     mosaic.thread_selected_index = -1
                                     mosaic.thread_stack = []
@@ -2149,11 +2146,11 @@ async def run_mosaic(
                             continue
 
                         # Handle thread loading cancellation
-                        if mosaic.thread_loading:
+                        if thread_loading:
                             if key == 'escape' or key == 'q':  # Cancel loading
                                 if thread_task and not thread_task.done():
                                     thread_task.cancel()
-                                mosaic.thread_loading = False
+                                thread_loading = False
                                 mosaic.thread_fetch_url = None
                                 mosaic.thread_background_refresh = False
                                 thread_task = None
@@ -2170,23 +2167,23 @@ async def run_mosaic(
                             new_shortcut = mosaic.navigate_grid(key)
                             if new_shortcut is not None:
                                 mosaic.selected_shortcut = new_shortcut
-                                mosaic.selected_tweet_num = new_shortcut
+                                selected_num = new_shortcut
                         elif key and key.isdigit() and key != '0':
                             # Select tweet (visual highlight) - don't open yet
                             num = int(key)
                             if mosaic.get_url_for_shortcut(num):
-                                mosaic.selected_tweet_num = num
+                                selected_num = num
                                 mosaic.selected_shortcut = num
                         elif key == 'o':
                             # Open selected tweet in browser
-                            if mosaic.selected_tweet_num:
-                                url = mosaic.get_url_for_shortcut(mosaic.selected_tweet_num)
+                            if selected_num:
+                                url = mosaic.get_url_for_shortcut(selected_num)
                                 if url:
                                     webbrowser.open(url)
                         elif key == 't':
                             # Load thread for selected tweet
-                            if mosaic.selected_tweet_num and thread_task is None:
-                                url = mosaic.get_url_for_shortcut(mosaic.selected_tweet_num)
+                            if selected_num and thread_task is None:
+                                url = mosaic.get_url_for_shortcut(selected_num)
                                 if url:
                                     mosaic.thread_stack = []  # Clear stack for fresh thread
                                     mosaic.thread_selected_index = -1
@@ -2196,7 +2193,7 @@ async def run_mosaic(
                                     if cached:
                                         # Show cached immediately
                                         mosaic.thread_context = cached
-                                        mosaic.thread_overlay_visible = True
+                                        overlay_visible = True
 
                                         # Start background refresh if stale
                                         if needs_refresh:
@@ -2205,7 +2202,7 @@ async def run_mosaic(
                                             thread_task = asyncio.create_task(fetch_thread(url))
                                     else:
                                         # Not cached - show loading and fetch
-                                        mosaic.thread_loading = True
+                                        thread_loading = True
                                         mosaic.thread_fetch_url = url
                                         thread_task = asyncio.create_task(fetch_thread(url))
                         elif key == 'd':
@@ -2225,21 +2222,32 @@ async def run_mosaic(
                                     time_window,
                                 )
                         elif key == '+' or key == '=':
-                            if mosaic.threshold < 10:
-                                mosaic.threshold += 1
-                                mosaic.refilter_tweets()
+                            if threshold_now < 10:
+                                threshold_now += 1
                         elif key == '-':
-                            if mosaic.threshold > 0:
-                                mosaic.threshold -= 1
-                                mosaic.refilter_tweets()
+                            if threshold_now > 0:
+                                threshold_now -= 1
                         elif key == 'c':
                             mosaic.cycle_count()
                         elif key == 'e':
-                            open_objectives_in_editor(keyboard, live)
+                            # Opened once the key state is written back below
+                            should_edit = True
+                            break  # Keys typed before the editor opened are stale
+
+                    mosaic.thread_overlay_visible = overlay_visible
+                    mosaic.thread_loading = thread_loading
+                    mosaic.selected_tweet_num = selected_num
+                    if threshold_now != mosaic.threshold:
+                        # Refilter once even if +/- was pressed several times
+                        mosaic.threshold = threshold_now
+                        mosaic.refilter_tweets()
 
                     if should_quit:
                         break
 
+                    if should_edit:
+                        open_objectives_in_editor(keyboard, live)
+
                     # Start background refresh if needed (manual or auto)
                     need_auto_refresh = now - last_refresh >= refresh_minutes * 60
                     if (should_refresh or need_auto_refresh) and refresh_task is None:
@@ -1,8 +1,11 @@
 """Author reputation tracking with SQLite storage."""
 
+import functools
 import sqlite3
+import threading
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -10,10 +13,170 @@ from xfeed.config import CONFIG_DIR, ensure_config_dir, load_config
 
 DB_FILE = CONFIG_DIR / "authors.db"
 
-
-@dataclass
+# Applied once when the connection is opened. WAL lets reads proceed while
+# a score is being written, and synchronous=NORMAL drops the per-commit
+# fsync that WAL makes unnecessary for durability of the database file.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",  # 64 MB
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA busy_timeout=5000",  # ms
+)
+
+# The write statements below take a {values} list so large batches can be
+# sent as one multi-row INSERT (see _insert_rows); each has a *_ROW tuple.
+UPSERT_AUTHOR_SQL = """
+    INSERT INTO authors (handle, display_name, last_seen)
+    VALUES {values}
+    ON CONFLICT(handle) DO UPDATE SET
+        display_name = excluded.display_name,
+        last_seen = CURRENT_TIMESTAMP
+"""
+UPSERT_AUTHOR_ROW = "(?, ?, CURRENT_TIMESTAMP)"
+
+# scored_at is passed explicitly: databases created before it became epoch
+# seconds still carry a CURRENT_TIMESTAMP (text) column default.
+INSERT_SCORE_SQL = """
+    INSERT INTO tweet_scores (author_handle, score, tweet_id, scored_at)
+    VALUES {values}
+"""
+INSERT_SCORE_ROW = "(?, ?, ?, ?)"
+
+# Running per-author totals, kept in step with tweet_scores on every write
+UPSERT_AUTHOR_AGG_SQL = """
+    INSERT INTO author_agg (handle, score_count, score_sum)
+    VALUES {values}
+    ON CONFLICT(handle) DO UPDATE SET
+        score_count = score_count + 1,
+        score_sum = score_sum + excluded.score_sum
+"""
+UPSERT_AUTHOR_AGG_ROW = "(?, 1, ?)"
+
+# All three summary counts in one statement; trusted authors come from
+# the running totals in author_agg rather than grouping tweet_scores
+STATS_SUMMARY_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM authors),
+        (SELECT COUNT(*) FROM tweet_scores),
+        (SELECT COUNT(*) FROM author_agg
+            WHERE score_count >= ? AND score_sum * 1.0 / score_count >= ?)
+"""
+
+# Stats for a set of authors in one pass over their tweet_scores rows.
+# {picked} selects the handles (usually from author_agg, so filtering and
+# LIMIT happen before any score rows are read). Window functions rank each
+# author's scores (overall and within the recent window) for the forgiving
+# average: the top 80% of scores, keeping at least one, so 1 bad take out
+# of 5 is forgiven. Callers append a WHERE/ORDER BY/LIMIT over the final
+# SELECT.
+AUTHOR_STATS_SQL = """
+    WITH picked AS ({picked}),
+    ranked AS (
+        SELECT
+            author_handle,
+            score,
+            scored_at,
+            ROW_NUMBER() OVER (
+                PARTITION BY author_handle ORDER BY score DESC
+            ) AS rn,
+            COUNT(*) OVER (PARTITION BY author_handle) AS n,
+            CASE WHEN scored_at > :recent_cutoff THEN ROW_NUMBER() OVER (
+                PARTITION BY author_handle, scored_at > :recent_cutoff
+                ORDER BY score DESC
+            ) END AS recent_rn,
+            SUM(scored_at > :recent_cutoff) OVER (
+                PARTITION BY author_handle
+            ) AS recent_n
+        FROM tweet_scores
+        WHERE author_handle IN (SELECT handle FROM picked)
+    ),
+    agg AS (
+        SELECT
+            author_handle,
+            MAX(n) AS total,
+            AVG(score) AS raw_avg,
+            AVG(CASE WHEN rn <= MAX(1, CAST(n * 0.8 AS INTEGER))
+                THEN score END) AS avg_score,
+            AVG(CASE WHEN recent_rn <= MAX(1, CAST(recent_n * 0.8 AS INTEGER))
+                THEN score END) AS recent_avg,
+            AVG(CASE WHEN scored_at > :week_ago THEN score END) AS week_avg,
+            AVG(CASE WHEN scored_at > :two_weeks_ago AND scored_at <= :week_ago
+                THEN score END) AS previous_week_avg
+        FROM ranked
+        GROUP BY author_handle
+    )
+    SELECT
+        a.handle, a.display_name, a.first_seen, a.last_seen,
+        agg.total, agg.avg_score, agg.recent_avg,
+        agg.week_avg, agg.previous_week_avg
+    FROM authors a
+    JOIN agg ON agg.author_handle = a.handle
+"""
+
+# tweet_scores.scored_at is stored as unix epoch seconds; the stats windows
+# are integer cutoffs relative to "now".
+DAY_SECONDS = 86400
+RECENT_DAYS = 30
+
+# Schema version kept in PRAGMA user_version (1 = epoch-second scored_at)
+SCHEMA_VERSION = 1
+
+# Week-over-week change in average score that counts as rising/declining
+TREND_DELTA = 0.5
+
+# Batches larger than this are written as multi-row INSERTs, each chunk
+# kept under SQLite's (pre-3.32) default limit of 999 bound parameters.
+BULK_INSERT_THRESHOLD = 50
+MAX_SQL_VARIABLES = 999
+
+# Max cached get_author_stats results per AuthorDB
+STATS_CACHE_SIZE = 1024
+
+# Cached stats are also keyed by this time bucket: recent_avg_score and trend
+# come from windows measured back from now, so even an author who is never
+# written again gets fresh windowed stats at least once per bucket.
+STATS_CACHE_BUCKET_SECONDS = 3600
+
+# Size of sqlite3's per-connection prepared statement cache. Every query
+# above is a fixed string, so each is parsed once and then reused.
+STATEMENT_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True, slots=True)
+class RepParams:
+    """Reputation thresholds resolved from config."""
+
+    min_samples: int = 5
+    trusted_threshold: float = 7.5
+    boost_max: float = 1.5
+
+    @classmethod
+    def from_config(cls, config: dict) -> "RepParams":
+        """Read the reputation_* keys from a config dict."""
+        return cls(
+            min_samples=config.get("reputation_minimum_samples", 5),
+            trusted_threshold=config.get("reputation_trusted_threshold", 7.5),
+            boost_max=config.get("reputation_boost_max", 1.5),
+        )
+
+
+def _rep_params(config: RepParams | dict | None) -> RepParams:
+    """Resolve a RepParams, a config dict, or None (load from file)."""
+    if isinstance(config, RepParams):
+        return config
+    if config is None:
+        config = load_config()
+    return RepParams.from_config(config)
+
+
+@dataclass(frozen=True, slots=True)
 class AuthorStats:
-    """Statistics for a tracked author."""
+    """Statistics for a tracked author.
+
+    Frozen because instances are shared out of the get_author_stats cache.
+    """
 
     handle: str
     display_name: str
@@ -25,39 +188,152 @@ class AuthorStats:
     trend: str  # "rising", "stable", "declining"
     is_trusted: bool
 
-    def reputation_boost(self, config: dict | None = None) -> float:
+    def reputation_boost(self, config: RepParams | dict | None = None) -> float:
         """Calculate reputation boost (0 to max configured boost)."""
-        if config is None:
-            config = load_config()
-
-        min_samples = config.get("reputation_minimum_samples", 5)
-        trusted_threshold = config.get("reputation_trusted_threshold", 7.5)
-        boost_max = config.get("reputation_boost_max", 1.5)
+        params = _rep_params(config)
 
-        if self.total_tweets_seen < min_samples:
+        if self.total_tweets_seen < params.min_samples:
             return 0.0
         if not self.is_trusted:
             return 0.0
 
         # Scale boost based on how far above trusted threshold
-        excess = self.avg_score - trusted_threshold
-        return min(boost_max, max(0, excess * 0.5))
+        excess = self.avg_score - params.trusted_threshold
+        return min(params.boost_max, max(0, excess * 0.5))
+
+
+def _window_cutoffs(now: float) -> dict[str, int]:
+    """Epoch-second cutoffs for the recent (30 day) and trend (7/14 day) windows."""
+    now = int(now)
+    return {
+        "recent_cutoff": now - RECENT_DAYS * DAY_SECONDS,
+        "week_ago": now - 7 * DAY_SECONDS,
+        "two_weeks_ago": now - 14 * DAY_SECONDS,
+    }
+
+
+def _normalize(handle: str) -> str:
+    """Lowercase a caller-supplied handle (stored handles are lowercase).
+
+    Already-lowercase handles are returned as-is, without a new string.
+    """
+    return handle if handle.islower() else handle.lower()
+
+
+@functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _insert_sql(sql: str, row_sql: str, row_count: int) -> str:
+    """Fill an INSERT template's {values} with row_count row placeholders.
+
+    Cached, so each write reuses the same string (and with it sqlite3's
+    prepared statement) instead of formatting the SQL again.
+    """
+    return sql.format(values=", ".join([row_sql] * row_count))
+
+
+def _insert_rows(
+    conn: sqlite3.Connection, sql: str, row_sql: str, rows: list[tuple]
+) -> None:
+    """Run an INSERT template for many rows.
+
+    Small batches use executemany; larger ones are chunked into multi-row
+    VALUES lists so SQLite runs one statement per chunk instead of per row.
+    """
+    if len(rows) <= BULK_INSERT_THRESHOLD:
+        conn.executemany(_insert_sql(sql, row_sql, 1), rows)
+        return
+
+    chunk_size = MAX_SQL_VARIABLES // len(rows[0])
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start : start + chunk_size]
+        conn.execute(
+            _insert_sql(sql, row_sql, len(chunk)),
+            [value for row in chunk for value in row],
+        )
+
+
+def _trend_from_averages(recent: float | None, previous: float | None) -> str:
+    """Classify a trend from this week's and last week's average scores."""
+    if recent is None or previous is None:
+        return "stable"
+
+    diff = recent - previous
+    if diff > TREND_DELTA:
+        return "rising"
+    elif diff < -TREND_DELTA:
+        return "declining"
+    return "stable"
 
 
 class AuthorDB:
     """SQLite database for author reputation tracking."""
 
-    def __init__(self, db_path: Path | None = None):
+    def __init__(self, db_path: Path | str | None = None):
         ensure_config_dir()
+        # ":memory:" gives a private in-memory database (tests)
         self.db_path = db_path or DB_FILE
+        # One long-lived connection for all calls. filter_tweets runs in an
+        # executor thread, so the connection is shared across threads and
+        # serialised with a (re-entrant) lock.
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        self._lock = threading.RLock()
+        # get_author_stats results are cached until the author's next write
+        # or the next time bucket: each write bumps that author's generation
+        # (part of the cache key), so scoring one author leaves everyone
+        # else's entries valid. Every entry from an earlier bucket is dead, so
+        # the generations are reset when the bucket rolls over, which bounds
+        # the dict to the authors written within one bucket.
+        self._author_generations: dict[str, int] = {}
+        self._generations_bucket = 0
+        self._cached_author_stats = functools.lru_cache(maxsize=STATS_CACHE_SIZE)(
+            self._get_author_stats_uncached
+        )
+        # Reputation thresholds, read from config on first use and kept until
+        # reload_config(), so per-tweet calls never re-read the YAML file.
+        self._params: RepParams | None = None
         self._init_db()
 
+    @property
+    def params(self) -> RepParams:
+        """Reputation thresholds used when a method is called without config."""
+        if self._params is None:
+            self._params = RepParams.from_config(load_config())
+        return self._params
+
+    def reload_config(self) -> RepParams:
+        """Re-read reputation thresholds from the config file."""
+        self._params = None
+        return self.params
+
+    def _resolve_params(self, config: RepParams | dict | None) -> RepParams:
+        """Resolve a per-call config, defaulting to the cached params."""
+        if config is None:
+            return self.params
+        return _rep_params(config)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "AuthorDB":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _init_db(self) -> None:
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS authors (
-                    handle TEXT PRIMARY KEY,
+                    handle TEXT PRIMARY KEY CHECK (handle = lower(handle)),
                     display_name TEXT,
                     first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -68,19 +344,62 @@ class AuthorDB:
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     author_handle TEXT NOT NULL,
                     score INTEGER NOT NULL,
-                    scored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    scored_at INTEGER NOT NULL
+                        DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
                     tweet_id TEXT,
                     FOREIGN KEY (author_handle) REFERENCES authors(handle)
                 )
             """)
+            if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                # scored_at used to be CURRENT_TIMESTAMP text (UTC); convert
+                # to epoch seconds so window filters compare integers
+                conn.execute("""
+                    UPDATE tweet_scores
+                    SET scored_at = CAST(strftime('%s', scored_at) AS INTEGER)
+                    WHERE typeof(scored_at) = 'text'
+                """)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            # Per-author count/sum maintained by record_tweet_scores so list
+            # queries can filter, order and limit without scanning scores.
+            has_agg = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                ("author_agg",),
+            ).fetchone()
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_scores_author
-                ON tweet_scores(author_handle)
+                CREATE TABLE IF NOT EXISTS author_agg (
+                    handle TEXT PRIMARY KEY,
+                    score_count INTEGER NOT NULL DEFAULT 0,
+                    score_sum INTEGER NOT NULL DEFAULT 0,
+                    FOREIGN KEY (handle) REFERENCES authors(handle)
+                )
+            """)
+            if not has_agg:
+                # Backfill from scores recorded before the table existed
+                conn.execute("""
+                    INSERT INTO author_agg (handle, score_count, score_sum)
+                    SELECT author_handle, COUNT(*), SUM(score)
+                    FROM tweet_scores
+                    GROUP BY author_handle
+                """)
+            # Covering index for every per-author query: seek on handle,
+            # range-scan scored_at, read score without touching the table.
+            # It subsumes the old single-column author index.
+            has_composite = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?",
+                ("idx_scores_author_time_score",),
+            ).fetchone()
+            conn.execute("DROP INDEX IF EXISTS idx_scores_author")
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_scores_author_time_score
+                ON tweet_scores(author_handle, scored_at, score)
             """)
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_scores_date
                 ON tweet_scores(scored_at)
             """)
+            if not has_composite:
+                # Give the planner statistics for the new index (once)
+                conn.execute("ANALYZE")
             conn.commit()
 
     def record_tweet_score(
@@ -91,32 +410,48 @@ class AuthorDB:
         tweet_id: str | None = None,
     ) -> None:
         """Record a scored tweet for an author."""
-        handle = author_handle.lower()
-        with sqlite3.connect(self.db_path) as conn:
-            # Upsert author
-            conn.execute(
-                """
-                INSERT INTO authors (handle, display_name, last_seen)
-                VALUES (?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(handle) DO UPDATE SET
-                    display_name = excluded.display_name,
-                    last_seen = CURRENT_TIMESTAMP
-            """,
-                (handle, display_name),
-            )
+        self.record_tweet_scores([(author_handle, display_name, score, tweet_id)])
 
-            # Record score
-            conn.execute(
-                """
-                INSERT INTO tweet_scores (author_handle, score, tweet_id)
-                VALUES (?, ?, ?)
-            """,
-                (handle, score, tweet_id),
+    def record_tweet_scores(
+        self, rows: list[tuple[str, str, int, str | None]]
+    ) -> None:
+        """Record many scored tweets in a single transaction.
+
+        Args:
+            rows: (author_handle, display_name, score, tweet_id) tuples
+        """
+        if not rows:
+            return
+        rows = [(_normalize(h), name, score, tid) for h, name, score, tid in rows]
+        now = int(time.time())
+        with self._lock:
+            conn = self._conn
+            _insert_rows(
+                conn,
+                UPSERT_AUTHOR_SQL,
+                UPSERT_AUTHOR_ROW,
+                [(handle, name) for handle, name, _, _ in rows],
+            )
+            _insert_rows(
+                conn,
+                INSERT_SCORE_SQL,
+                INSERT_SCORE_ROW,
+                [(handle, score, tid, now) for handle, _, score, tid in rows],
+            )
+            _insert_rows(
+                conn,
+                UPSERT_AUTHOR_AGG_SQL,
+                UPSERT_AUTHOR_AGG_ROW,
+                [(handle, score) for handle, _, score, _ in rows],
             )
             conn.commit()
+            self._stats_bucket()
+            generations = self._author_generations
+            for handle in {handle for handle, _, _, _ in rows}:
+                generations[handle] = generations.get(handle, 0) + 1
 
     def get_author_stats(
-        self, author_handle: str, config: dict | None = None
+        self, author_handle: str, config: RepParams | dict | None = None
     ) -> Optional[AuthorStats]:
         """Get reputation statistics for an author.
 
@@ -124,240 +459,173 @@ class AuthorDB:
         Philosophy: "Up like a rock, down like a feather"
         - Good takes boost reputation quickly
         - Occasional bad takes don't tank trusted authors
-        """
-        if config is None:
-            config = load_config()
 
-        min_samples = config.get("reputation_minimum_samples", 5)
-        trusted_threshold = config.get("reputation_trusted_threshold", 7.5)
-        decay_days = 30
+        Results are cached per (handle, params) until that author's next write,
+        or for at most STATS_CACHE_BUCKET_SECONDS.
+        """
+        handle = _normalize(author_handle)
+        params = self._resolve_params(config)
+        # Roll the bucket over before reading the generation: a rollover
+        # resets the generations, and a key pairing a pre-reset generation
+        # with the new bucket would match again after that many writes.
+        with self._lock:
+            bucket = self._stats_bucket()
+            generation = self._author_generations.get(handle, 0)
+        return self._cached_author_stats(handle, params, generation, bucket)
+
+    def _stats_bucket(self) -> int:
+        """Current stats cache time bucket, dropping the last one's state."""
+        bucket = int(time.time() // STATS_CACHE_BUCKET_SECONDS)
+        if bucket != self._generations_bucket:
+            with self._lock:
+                self._author_generations.clear()
+                self._cached_author_stats.cache_clear()
+                self._generations_bucket = bucket
+        return bucket
+
+    def _get_author_stats_uncached(
+        self,
+        handle: str,
+        params: RepParams,
+        generation: int,
+        time_bucket: int,
+    ) -> Optional[AuthorStats]:
+        """Query stats for a lowercased handle.
 
-        handle = author_handle.lower()
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        generation and time_bucket only key the cache.
+        """
+        # Same single statement the list methods use, picking one handle
+        stats = self._query_author_stats(
+            "SELECT :handle AS handle", "", {"handle": handle}, params
+        )
+        return stats[0] if stats else None
+
+    def _query_author_stats(
+        self, picked: str, clause: str, sql_params: dict, params: RepParams
+    ) -> list[AuthorStats]:
+        """Run AUTHOR_STATS_SQL for the picked handles and build AuthorStats."""
+        sql_params = {**sql_params, **_window_cutoffs(time.time())}
 
-            # Get author info
-            author = conn.execute(
-                "SELECT * FROM authors WHERE handle = ?", (handle,)
-            ).fetchone()
-            if not author:
-                return None
-
-            # Get all scores for forgiving average calculation
-            all_scores = conn.execute(
-                """
-                SELECT score FROM tweet_scores
-                WHERE author_handle = ?
-                ORDER BY score DESC
-            """,
-                (handle,),
+        with self._lock:
+            rows = self._conn.execute(
+                AUTHOR_STATS_SQL.format(picked=picked) + clause, sql_params
             ).fetchall()
 
-            total_count = len(all_scores)
-            if total_count == 0:
-                return None
-
-            # Forgiving average: use top 80% of scores (ignore worst 20%)
-            # This means 1 bad take out of 5 is forgiven, 2 out of 10, etc.
-            keep_count = max(1, int(total_count * 0.8))
-            top_scores = [row["score"] for row in all_scores[:keep_count]]
-            avg_score = sum(top_scores) / len(top_scores)
-
-            # Get recent stats (last 30 days) - also forgiving
-            cutoff = (datetime.now() - timedelta(days=decay_days)).isoformat()
-            recent_scores = conn.execute(
-                """
-                SELECT score FROM tweet_scores
-                WHERE author_handle = ? AND scored_at > ?
-                ORDER BY score DESC
-            """,
-                (handle, cutoff),
-            ).fetchall()
-
-            if recent_scores:
-                recent_keep = max(1, int(len(recent_scores) * 0.8))
-                recent_top = [row["score"] for row in recent_scores[:recent_keep]]
-                recent_avg = sum(recent_top) / len(recent_top)
-            else:
-                recent_avg = avg_score
-
-            # Calculate trend
-            trend = self._calculate_trend(conn, handle)
-
-            is_trusted = (
-                total_count >= min_samples and avg_score >= trusted_threshold
-            )
-
-            return AuthorStats(
+        return [
+            AuthorStats(
                 handle=handle,
-                display_name=author["display_name"],
-                total_tweets_seen=total_count,
+                display_name=display_name,
+                total_tweets_seen=total,
                 avg_score=avg_score,
-                recent_avg_score=recent_avg,
-                last_seen=datetime.fromisoformat(author["last_seen"]),
-                first_seen=datetime.fromisoformat(author["first_seen"]),
-                trend=trend,
-                is_trusted=is_trusted,
+                recent_avg_score=(
+                    recent_avg if recent_avg is not None else avg_score
+                ),
+                last_seen=datetime.fromisoformat(last_seen),
+                first_seen=datetime.fromisoformat(first_seen),
+                trend=_trend_from_averages(week_avg, previous_week_avg),
+                is_trusted=(
+                    total >= params.min_samples
+                    and avg_score >= params.trusted_threshold
+                ),
             )
-
-    def _calculate_trend(self, conn: sqlite3.Connection, handle: str) -> str:
-        """Calculate author's trend direction."""
-        # Compare last 7 days to previous 7-14 days
-        now = datetime.now()
-        week_ago = (now - timedelta(days=7)).isoformat()
-        two_weeks_ago = (now - timedelta(days=14)).isoformat()
-
-        recent = conn.execute(
-            """
-            SELECT AVG(score) FROM tweet_scores
-            WHERE author_handle = ? AND scored_at > ?
-        """,
-            (handle, week_ago),
-        ).fetchone()[0]
-
-        previous = conn.execute(
-            """
-            SELECT AVG(score) FROM tweet_scores
-            WHERE author_handle = ? AND scored_at > ? AND scored_at <= ?
-        """,
-            (handle, two_weeks_ago, week_ago),
-        ).fetchone()[0]
-
-        if recent is None or previous is None:
-            return "stable"
-
-        diff = recent - previous
-        if diff > 0.5:
-            return "rising"
-        elif diff < -0.5:
-            return "declining"
-        return "stable"
+            for (
+                handle,
+                display_name,
+                first_seen,
+                last_seen,
+                total,
+                avg_score,
+                recent_avg,
+                week_avg,
+                previous_week_avg,
+            ) in rows
+        ]
 
     def get_trusted_authors(
-        self, limit: int = 50, config: dict | None = None
+        self, limit: int = 50, config: RepParams | dict | None = None
     ) -> list[AuthorStats]:
         """Get list of trusted authors sorted by reputation."""
-        if config is None:
-            config = load_config()
-
-        min_samples = config.get("reputation_minimum_samples", 5)
-        trusted_threshold = config.get("reputation_trusted_threshold", 7.5)
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                """
-                SELECT a.handle
-                FROM authors a
-                JOIN tweet_scores s ON a.handle = s.author_handle
-                GROUP BY a.handle
-                HAVING COUNT(s.id) >= ? AND AVG(s.score) >= ?
-                ORDER BY AVG(s.score) DESC
-                LIMIT ?
-            """,
-                (min_samples, trusted_threshold, limit),
-            ).fetchall()
+        params = self._resolve_params(config)
 
-            return [
-                stats
-                for row in rows
-                if (stats := self.get_author_stats(row["handle"], config)) is not None
-            ]
+        return self._query_author_stats(
+            """
+            SELECT handle FROM author_agg
+            WHERE score_count >= :min_samples
+                AND score_sum * 1.0 / score_count >= :threshold
+            ORDER BY score_sum * 1.0 / score_count DESC
+            LIMIT :limit
+            """,
+            "ORDER BY agg.raw_avg DESC",
+            {
+                "min_samples": params.min_samples,
+                "threshold": params.trusted_threshold,
+                "limit": limit,
+            },
+            params,
+        )
 
     def get_rising_authors(
-        self, limit: int = 20, config: dict | None = None
+        self, limit: int = 20, config: RepParams | dict | None = None
     ) -> list[AuthorStats]:
         """Get authors with rising reputation scores."""
-        if config is None:
-            config = load_config()
-
-        # Get all authors with at least 3 samples, then filter by trend
-        with sqlite3.connect(self.db_path) as conn:
-            handles = conn.execute(
-                """
-                SELECT DISTINCT author_handle FROM tweet_scores
-                GROUP BY author_handle
-                HAVING COUNT(*) >= 3
-            """
-            ).fetchall()
-
-        all_stats = []
-        for (handle,) in handles:
-            stats = self.get_author_stats(handle, config)
-            if stats and stats.trend == "rising":
-                all_stats.append(stats)
+        params = self._resolve_params(config)
 
-        all_stats.sort(key=lambda x: x.recent_avg_score, reverse=True)
-        return all_stats[:limit]
+        # Authors with at least 3 samples whose trend is "rising"
+        return self._query_author_stats(
+            "SELECT handle FROM author_agg WHERE score_count >= 3",
+            """
+            WHERE agg.week_avg - agg.previous_week_avg > :trend_delta
+            ORDER BY COALESCE(agg.recent_avg, agg.avg_score) DESC
+            LIMIT :limit
+            """,
+            {"trend_delta": TREND_DELTA, "limit": limit},
+            params,
+        )
 
     def get_all_authors(
-        self, limit: int = 100, config: dict | None = None
+        self, limit: int = 100, config: RepParams | dict | None = None
     ) -> list[AuthorStats]:
         """Get all tracked authors sorted by tweet count."""
-        if config is None:
-            config = load_config()
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                """
-                SELECT a.handle
-                FROM authors a
-                JOIN tweet_scores s ON a.handle = s.author_handle
-                GROUP BY a.handle
-                ORDER BY COUNT(s.id) DESC
-                LIMIT ?
-            """,
-                (limit,),
-            ).fetchall()
+        params = self._resolve_params(config)
 
-            return [
-                stats
-                for row in rows
-                if (stats := self.get_author_stats(row["handle"], config)) is not None
-            ]
+        return self._query_author_stats(
+            """
+            SELECT handle FROM author_agg
+            ORDER BY score_count DESC
+            LIMIT :limit
+            """,
+            "ORDER BY agg.total DESC",
+            {"limit": limit},
+            params,
+        )
 
     def clear_all(self) -> int:
         """Clear all author data. Returns count of authors deleted."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
             count = conn.execute("SELECT COUNT(*) FROM authors").fetchone()[0]
             conn.execute("DELETE FROM tweet_scores")
+            conn.execute("DELETE FROM author_agg")
             conn.execute("DELETE FROM authors")
             conn.commit()
+            self._author_generations.clear()
+            self._cached_author_stats.cache_clear()
             return count
 
-    def get_stats_summary(self, config: dict | None = None) -> dict:
+    def get_stats_summary(self, config: RepParams | dict | None = None) -> dict:
         """Get summary statistics for the database."""
-        if config is None:
-            config = load_config()
-
-        min_samples = config.get("reputation_minimum_samples", 5)
-        trusted_threshold = config.get("reputation_trusted_threshold", 7.5)
-
-        with sqlite3.connect(self.db_path) as conn:
-            authors_count = conn.execute("SELECT COUNT(*) FROM authors").fetchone()[0]
-            scores_count = conn.execute("SELECT COUNT(*) FROM tweet_scores").fetchone()[
-                0
-            ]
-
-            # Count trusted authors
-            trusted_result = conn.execute(
-                """
-                SELECT COUNT(*) FROM (
-                    SELECT author_handle
-                    FROM tweet_scores
-                    GROUP BY author_handle
-                    HAVING COUNT(*) >= ? AND AVG(score) >= ?
-                )
-            """,
-                (min_samples, trusted_threshold),
+        params = self._resolve_params(config)
+
+        with self._lock:
+            authors_count, scores_count, trusted_count = self._conn.execute(
+                STATS_SUMMARY_SQL, (params.min_samples, params.trusted_threshold)
             ).fetchone()
 
-            return {
-                "total_authors": authors_count,
-                "total_scores": scores_count,
-                "trusted_authors": trusted_result[0] if trusted_result else 0,
-            }
+        return {
+            "total_authors": authors_count,
+            "total_scores": scores_count,
+            "trusted_authors": trusted_count,
+        }
 
 
 # Module-level singleton for convenience
@@ -1,17 +1,37 @@
 """Session state tracking with SQLite storage."""
 
 import json
-import pickle
+import os
 import sqlite3
-from dataclasses import asdict
+import threading
+from dataclasses import is_dataclass
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 from typing import Any
 
 from xfeed.config import CONFIG_DIR, ensure_config_dir
+from xfeed.models import (
+    FilteredTweet,
+    LinkSummary,
+    MyEngagementStats,
+    Notification,
+    NotificationType,
+    QuotedTweet,
+    TopicVibe,
+    Tweet,
+)
+from xfeed.reputation import CONNECTION_PRAGMAS
 
 DB_FILE = CONFIG_DIR / "authors.db"
-CACHE_FILE = CONFIG_DIR / "tweet_cache.pkl"
+CACHE_FILE = CONFIG_DIR / "tweet_cache.json"
+
+# Cached tweets younger than this are reused by fetches, which then only
+# refresh their engagement counts
+TWEET_CACHE_REUSE_MINUTES = 5
+
+# Cached vibe responses older than this are dropped when a new one is stored
+VIBE_CACHE_MAX_AGE_DAYS = 7
 
 
 class SessionDB:
@@ -20,11 +40,25 @@ class SessionDB:
     def __init__(self, db_path: Path | None = None):
         ensure_config_dir()
         self.db_path = db_path or DB_FILE
+        # One long-lived connection, shared across threads like AuthorDB's
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.RLock()
+        # last_seen_at as last read or written through this instance
+        self._last_seen: datetime | None = None
+        self._last_seen_loaded = False
         self._init_db()
 
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
     def _init_db(self) -> None:
-        """Initialize session_state table if needed."""
-        with sqlite3.connect(self.db_path) as conn:
+        """Initialize session_state and vibe_cache tables if needed."""
+        with self._lock:
+            conn = self._conn
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS session_state (
                     key TEXT PRIMARY KEY,
@@ -32,23 +66,32 @@ class SessionDB:
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS vibe_cache (
+                    key TEXT PRIMARY KEY,
+                    json TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
             conn.commit()
 
     def get_last_seen(self) -> datetime | None:
-        """Get timestamp of last digest view."""
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
-                "SELECT value FROM session_state WHERE key = 'last_seen_at'"
-            ).fetchone()
-            if row and row[0]:
-                return datetime.fromisoformat(row[0])
-            return None
+        """Get timestamp of last digest view (read once, then cached)."""
+        with self._lock:
+            if not self._last_seen_loaded:
+                row = self._conn.execute(
+                    "SELECT value FROM session_state WHERE key = 'last_seen_at'"
+                ).fetchone()
+                self._last_seen = datetime.fromisoformat(row[0]) if row and row[0] else None
+                self._last_seen_loaded = True
+            return self._last_seen
 
     def set_last_seen(self, timestamp: datetime | None = None) -> None:
         """Set last seen timestamp (defaults to now)."""
         if timestamp is None:
             timestamp = datetime.now()
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
             conn.execute(
                 """
                 INSERT INTO session_state (key, value, updated_at)
@@ -60,6 +103,8 @@ class SessionDB:
                 (timestamp.isoformat(),),
             )
             conn.commit()
+            self._last_seen = timestamp
+            self._last_seen_loaded = True
 
     def get_last_seen_hours_ago(self) -> float | None:
         """Get hours since last digest view, or None if never viewed."""
@@ -69,6 +114,34 @@ class SessionDB:
         diff = datetime.now() - last_seen
         return diff.total_seconds() / 3600
 
+    def get_cached_vibe(self, key: str) -> str | None:
+        """Get the cached vibe response (JSON) for a tweet-set key, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT json FROM vibe_cache WHERE key = ?", (key,)
+            ).fetchone()
+            return row[0] if row else None
+
+    def set_cached_vibe(self, key: str, vibe_json: str) -> None:
+        """Cache a vibe response (JSON) for a tweet-set key, dropping stale entries."""
+        with self._lock:
+            conn = self._conn
+            conn.execute(
+                "DELETE FROM vibe_cache WHERE created_at < datetime('now', ?)",
+                (f"-{VIBE_CACHE_MAX_AGE_DAYS} days",),
+            )
+            conn.execute(
+                """
+                INSERT INTO vibe_cache (key, json, created_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(key) DO UPDATE SET
+                    json = excluded.json,
+                    created_at = CURRENT_TIMESTAMP
+            """,
+                (key, vibe_json),
+            )
+            conn.commit()
+
 
 # Module-level singleton
 _session_db: SessionDB | None = None
@@ -82,7 +155,61 @@ def get_session_db() -> SessionDB:
     return _session_db
 
 
-# Tweet cache for faster startup during development
+# Tweet cache for faster startup during development.
+# Stored as JSON: models are written field by field and rebuilt explicitly on
+# load, so nothing is ever unpickled and a stale file simply fails to load.
+def _encode_cache_value(value: Any) -> Any:
+    """json.dumps default hook for the model types held in the cache."""
+    if is_dataclass(value):
+        return vars(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Cannot cache {type(value).__name__}")
+
+
+def _tweet_from_cache(data: dict) -> Tweet:
+    """Rebuild a Tweet from its cached fields."""
+    quoted = data["quoted_tweet"]
+    return Tweet(**{
+        **data,
+        "timestamp": datetime.fromisoformat(data["timestamp"]),
+        "quoted_tweet": QuotedTweet(**quoted) if quoted else None,
+    })
+
+
+def _notification_from_cache(data: dict) -> Notification:
+    """Rebuild a Notification from its cached fields."""
+    return Notification(**{
+        **data,
+        "type": NotificationType(data["type"]),
+        "timestamp": datetime.fromisoformat(data["timestamp"]),
+    })
+
+
+def _filtered_tweet_from_cache(data: dict) -> FilteredTweet:
+    """Rebuild a FilteredTweet from its cached fields."""
+    return FilteredTweet(**{
+        **data,
+        "tweet": _tweet_from_cache(data["tweet"]),
+        "link_summaries": [LinkSummary(**link) for link in data["link_summaries"]],
+    })
+
+
+def _engagement_stats_from_cache(data: dict) -> MyEngagementStats:
+    """Rebuild MyEngagementStats from its cached fields."""
+    return MyEngagementStats(**{
+        **data,
+        "profile_tweets": [_tweet_from_cache(t) for t in data["profile_tweets"]],
+        "recent_notifications": [
+            _notification_from_cache(n) for n in data["recent_notifications"]
+        ],
+        "top_likers": [tuple(pair) for pair in data["top_likers"]],
+        "top_retweeters": [tuple(pair) for pair in data["top_retweeters"]],
+    })
+
+
 def save_tweet_cache(
     tweets: list,
     vibes: list | None = None,
@@ -106,9 +233,15 @@ def save_tweet_cache(
         "my_handle": my_handle,
         "cached_at": datetime.now().isoformat(),
     }
+    # Write a temp file and swap it in, so a crash mid-write never leaves a
+    # truncated cache behind for load_tweet_cache to trip over
+    tmp_file = CACHE_FILE.with_suffix(".json.tmp")
     try:
-        with open(CACHE_FILE, "wb") as f:
-            pickle.dump(cache_data, f)
+        tmp_file.write_text(
+            json.dumps(cache_data, default=_encode_cache_value, separators=(",", ":")),
+            encoding="utf-8",
+        )
+        os.replace(tmp_file, CACHE_FILE)
     except Exception:
         pass  # Silently fail - cache is optional
 
@@ -125,18 +258,42 @@ def load_tweet_cache() -> dict | None:
         return None
 
     try:
-        with open(CACHE_FILE, "rb") as f:
-            cache_data = pickle.load(f)
+        cache_data = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
 
         # Validate cache has required data
         if not cache_data.get("tweets"):
             return None
 
+        stats = cache_data.get("engagement_stats")
+        cache_data["tweets"] = [_filtered_tweet_from_cache(t) for t in cache_data["tweets"]]
+        cache_data["vibes"] = [TopicVibe(**v) for v in cache_data.get("vibes") or []]
+        cache_data["engagement_stats"] = _engagement_stats_from_cache(stats) if stats else None
         return cache_data
     except Exception:
         return None
 
 
+def load_recent_cached_tweets() -> dict[str, Tweet]:
+    """
+    Get the cached tweets, keyed by id, if the cache is fresh enough to reuse.
+
+    Fetches re-read only the engagement counts of these tweets instead of
+    extracting them again. Empty if there is no cache or it is older than
+    TWEET_CACHE_REUSE_MINUTES.
+    """
+    cache = load_tweet_cache()
+    if not cache:
+        return {}
+
+    try:
+        age = datetime.now() - datetime.fromisoformat(cache["cached_at"])
+    except Exception:
+        return {}
+    if age.total_seconds() > TWEET_CACHE_REUSE_MINUTES * 60:
+        return {}
+    return {ft.tweet.id: ft.tweet for ft in cache["tweets"]}
+
+
 def get_cache_age_minutes() -> float | None:
     """Get age of cache in minutes, or None if no cache."""
     cache = load_tweet_cache()
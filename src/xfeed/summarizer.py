@@ -1,12 +1,19 @@
 """LLM-based topic extraction and vibe analysis."""
 
+import asyncio
+import hashlib
 import json
-import re
 
-import anthropic
-
-from xfeed.config import get_api_key, load_objectives
+from xfeed.config import get_api_key, get_async_client, load_objectives
 from xfeed.models import FilteredTweet, TopicVibe
+from xfeed.session import get_session_db
+
+
+# Tweets scored below this add noise, not topics, so they are left out
+VIBE_MIN_RELEVANCE = 3
+
+# Tweets whose content starts the same (retweets, copy-paste posts) are sent once
+VIBE_DEDUP_PREFIX = 120
 
 
 SYSTEM_PROMPT = """You are an expert at analyzing social media discussions to identify key themes and their overall sentiment.
@@ -39,36 +46,74 @@ USER_PROMPT = """Analyze these {count} tweets and identify 2-3 main topics with
 Respond with only the JSON array, no other text."""
 
 
+def select_tweets_for_vibe(tweets: list[FilteredTweet]) -> list[FilteredTweet]:
+    """Drop low-relevance and near-duplicate tweets before vibe analysis."""
+    seen: set[str] = set()
+    kept = []
+    for ft in tweets:
+        if ft.relevance_score < VIBE_MIN_RELEVANCE:
+            continue
+        key = ft.tweet.content[:VIBE_DEDUP_PREFIX]
+        if key in seen:
+            continue
+        seen.add(key)
+        kept.append(ft)
+    return kept
+
+
 def format_tweets_for_vibe(tweets: list[FilteredTweet]) -> str:
     """Format filtered tweets for vibe analysis."""
-    lines = []
-    for i, ft in enumerate(tweets, 1):
-        t = ft.tweet
-        # Include the filter's reason as context
-        lines.append(f"{i}. [{ft.relevance_score}/10] {t.author_handle}: {t.content[:300]}")
-        lines.append(f"   Relevance: {ft.reason}")
-        lines.append("")
-    return "\n".join(lines)
+    # Include the filter's reason as context
+    return "\n".join(
+        f"{i}. [{ft.relevance_score}/10] {ft.tweet.author_handle}: {ft.tweet.content[:300]}\n"
+        f"   Relevance: {ft.reason}\n"
+        for i, ft in enumerate(tweets, 1)
+    )
+
+
+def vibe_cache_key(tweets: list[FilteredTweet], objectives: str) -> str:
+    """Fingerprint the vibe inputs: tweet ids with their scores, plus objectives."""
+    # blake2b: the fastest stdlib hash for short inputs like this
+    fingerprint = ",".join(sorted(f"{ft.tweet.id}:{ft.relevance_score}" for ft in tweets))
+    return hashlib.blake2b(
+        f"{objectives}\n{fingerprint}".encode(), digest_size=16
+    ).hexdigest()
 
 
 def parse_vibe_response(response_text: str) -> list[dict]:
     """Parse the JSON response from the model."""
-    # Try to extract JSON array from the response
-    json_match = re.search(r'\[[\s\S]*\]', response_text)
-    if json_match:
+    # Try to extract the outermost JSON array (first "[" to last "]") from
+    # the response; two string scans, no regex
+    start = response_text.find("[")
+    end = response_text.rfind("]")
+    if start != -1 and end > start:
         try:
-            return json.loads(json_match.group())
-        except json.JSONDecodeError:
+            return json.loads(response_text[start:end + 1])
+        except ValueError:
             pass
 
     # Fallback: try parsing the whole response
     try:
         return json.loads(response_text)
-    except json.JSONDecodeError:
+    except ValueError:
         return []
 
 
-def extract_vibe(tweets: list[FilteredTweet]) -> list[TopicVibe]:
+def vibes_from_data(vibe_data: list[dict]) -> list[TopicVibe]:
+    """Build TopicVibe objects from parsed response data (max 3 topics)."""
+    vibes = []
+    for item in vibe_data[:3]:  # Max 3 topics
+        vibes.append(TopicVibe(
+            topic=item.get("topic", "Unknown"),
+            vibe=item.get("vibe", "Neutral"),
+            emoji=item.get("emoji", "💭"),
+            description=item.get("description", ""),
+            tweet_count=item.get("tweet_count", 0),
+        ))
+    return vibes
+
+
+async def extract_vibe(tweets: list[FilteredTweet]) -> list[TopicVibe]:
     """
     Extract topic vibes from filtered tweets using Claude.
 
@@ -78,6 +123,7 @@ def extract_vibe(tweets: list[FilteredTweet]) -> list[TopicVibe]:
     Returns:
         List of TopicVibe objects (2-3 topics)
     """
+    tweets = select_tweets_for_vibe(tweets)
     if not tweets:
         return []
 
@@ -86,15 +132,34 @@ def extract_vibe(tweets: list[FilteredTweet]) -> list[TopicVibe]:
         return []
 
     objectives = load_objectives()
-    client = anthropic.Anthropic(api_key=api_key)
+
+    # The same tweet set (e.g. reloaded from the tweet cache) gets the same
+    # vibes, so reuse a stored response instead of calling the API again.
+    # The SQLite reads and writes run in a thread, off the event loop.
+    db = get_session_db()
+    cache_key = vibe_cache_key(tweets, objectives)
+    cached = await asyncio.to_thread(db.get_cached_vibe, cache_key)
+    if cached is not None:
+        return vibes_from_data(json.loads(cached))
+
+    # Shared async client, so the call overlaps with the caller's other work
+    # and reuses the connection pool across calls
+    client = await get_async_client(api_key)
 
     tweets_text = format_tweets_for_vibe(tweets)
 
     try:
-        response = client.messages.create(
+        response = await client.messages.create(
             model="claude-3-5-haiku-20241022",
             max_tokens=1000,
-            system=SYSTEM_PROMPT.format(objectives=objectives),
+            # The system prompt is identical for every call in a session, so
+            # mark it for prompt caching (applied by the API once the prefix
+            # is long enough, i.e. with longer objectives)
+            system=[{
+                "type": "text",
+                "text": SYSTEM_PROMPT.format(objectives=objectives),
+                "cache_control": {"type": "ephemeral"},
+            }],
             messages=[
                 {"role": "user", "content": USER_PROMPT.format(
                     count=len(tweets),
@@ -105,16 +170,12 @@ def extract_vibe(tweets: list[FilteredTweet]) -> list[TopicVibe]:
 
         response_text = response.content[0].text
         vibe_data = parse_vibe_response(response_text)
-
-        vibes = []
-        for item in vibe_data[:3]:  # Max 3 topics
-            vibes.append(TopicVibe(
-                topic=item.get("topic", "Unknown"),
-                vibe=item.get("vibe", "Neutral"),
-                emoji=item.get("emoji", "💭"),
-                description=item.get("description", ""),
-                tweet_count=item.get("tweet_count", 0),
-            ))
+        vibes = vibes_from_data(vibe_data)
+        # Unparseable responses aren't cached, so the next call retries
+        if vibes:
+            await asyncio.to_thread(
+                db.set_cached_vibe, cache_key, json.dumps(vibe_data[:3])
+            )
 
         return vibes
 
@@ -2,7 +2,6 @@
 
 import asyncio
 import time
-from datetime import datetime
 
 from rich.console import Console, Group
 from rich.live import Live
@@ -19,6 +18,22 @@ from xfeed.models import FilteredTweet
 FILLED = "▰"
 EMPTY = "▱"
 
+# Every bar for the widths the ticker draws (full and compact), indexed by
+# the number of filled cells
+PROGRESS_BARS = {
+    width: [FILLED * filled + EMPTY * (width - filled) for filled in range(width + 1)]
+    for width in (8, 12)
+}
+
+# Transitions: each tweet fades in over the first FADE_SECONDS of its rotation
+# (opacity 0.3 -> 1.0) and out over the last (1.0 -> 0.3). Rendering only
+# distinguishes three opacity buckets: 0 dim (< 0.5), 1 mid (< 1.0), 2 full.
+FADE_SECONDS = 0.3
+# Fade-in is dim until opacity reaches 0.5, i.e. for 0.2/0.7 of the fade
+DIM_IN_SECONDS = FADE_SECONDS * 0.2 / 0.7
+# Representative opacity for each bucket, as passed to render_tweet
+OPACITY_BY_BUCKET = (0.3, 0.7, 1.0)
+
 
 def format_engagement(likes: int, retweets: int) -> str:
     """Format engagement numbers compactly."""
@@ -37,10 +52,18 @@ def format_engagement(likes: int, retweets: int) -> str:
     return "  ".join(parts) if parts else ""
 
 
+def progress_filled(elapsed: float, total: float, width: int = 12) -> int:
+    """Number of filled cells in a progress bar of the given width."""
+    progress = min(elapsed / total, 1.0)
+    return int(progress * width)
+
+
 def create_progress_bar(elapsed: float, total: float, width: int = 12) -> str:
     """Create a visual progress bar."""
-    progress = min(elapsed / total, 1.0)
-    filled = int(progress * width)
+    filled = progress_filled(elapsed, total, width)
+    bars = PROGRESS_BARS.get(width)
+    if bars is not None:
+        return bars[filled]
     return FILLED * filled + EMPTY * (width - filled)
 
 
@@ -58,10 +81,44 @@ class TickerDisplay:
         self.current_index = 0
         self.rotate_seconds = rotate_seconds
         self.refresh_minutes = refresh_minutes
-        self.last_refresh = datetime.now()
         self.console = Console()
         self.transition_phase = 0  # 0 = normal, 1-3 = transitioning
         self.compact = compact
+        # Fade-out thresholds depend only on rotate_seconds; past
+        # _dim_out_start the fade-out opacity is below 0.5
+        self._fade_out_start = rotate_seconds - FADE_SECONDS
+        self._dim_out_start = rotate_seconds - FADE_SECONDS / 2
+        # Built tweet panels by (tweet index, opacity bucket); a panel only
+        # changes when the tweet or the bucket does, not every frame
+        self._tweet_panels: dict[tuple[int, int], Panel] = {}
+        # frame_key of the last frame render_if_changed returned
+        self._last_frame_key: tuple | None = None
+        # The header never changes, so it is built once
+        self._header = self.render_header()
+        self._centered_header = Align.center(self._header)
+        # Full-mode frame: one Group for the ticker's lifetime whose tweet
+        # and status slots are swapped in place when they change
+        self._frame = Group(self._centered_header, Text(), Text())
+        self._precompute()
+
+    def _precompute(self) -> None:
+        """Build the per-tweet values the per-frame renderers index into.
+
+        They depend only on the tweet, so they are computed once per tweet
+        list instead of on every frame.
+        """
+        self._engagement = [
+            format_engagement(ft.tweet.likes, ft.tweet.retweets) for ft in self.tweets
+        ]
+        self._score_styles = [self.get_score_style(ft.relevance_score) for ft in self.tweets]
+        self._compact_content = []
+        for ft in self.tweets:
+            # Leave room for author handle, truncate content
+            max_content = 100 - len(ft.tweet.author_handle)
+            content = ft.tweet.content.replace("\n", " ")
+            if len(content) > max_content:
+                content = content[:max_content - 3] + "..."
+            self._compact_content.append(content)
 
     def get_score_style(self, score: int) -> Style:
         """Get color style based on relevance score."""
@@ -72,6 +129,16 @@ class TickerDisplay:
         else:
             return Style(color="white")
 
+    def opacity_bucket(self, elapsed: float) -> int:
+        """Opacity bucket at this point in the rotation: 0 dim, 1 mid, 2 full."""
+        if elapsed > self._fade_out_start:
+            # Fade out
+            return 0 if elapsed > self._dim_out_start else 1
+        elif elapsed < FADE_SECONDS:
+            # Fade in
+            return 0 if elapsed < DIM_IN_SECONDS else 1
+        return 2
+
     def render_tweet(self, ft: FilteredTweet, opacity: float = 1.0) -> Panel:
         """Render a single tweet as a panel."""
         tweet = ft.tweet
@@ -114,8 +181,12 @@ class TickerDisplay:
             padding=(0, 1),
         )
 
-    def render_status_bar(self, elapsed: float) -> Text:
-        """Render the bottom status bar."""
+    def render_status_bar(self, elapsed: float, elapsed_refresh: float = 0.0) -> Text:
+        """Render the bottom status bar.
+
+        elapsed_refresh is the seconds since the last refresh, as tracked by
+        the caller's loop.
+        """
         remaining = max(0, self.rotate_seconds - elapsed)
         progress = create_progress_bar(elapsed, self.rotate_seconds)
 
@@ -123,25 +194,22 @@ class TickerDisplay:
         pos = f"[{self.current_index + 1}/{len(self.tweets)}]"
 
         # Engagement for current tweet
-        if self.tweets:
-            ft = self.tweets[self.current_index]
-            engagement = format_engagement(ft.tweet.likes, ft.tweet.retweets)
-        else:
-            engagement = ""
+        engagement = self._engagement[self.current_index] if self.tweets else ""
 
         # Time until next refresh
-        mins_since_refresh = (datetime.now() - self.last_refresh).seconds // 60
+        mins_since_refresh = int(elapsed_refresh // 60)
         mins_until_refresh = max(0, self.refresh_minutes - mins_since_refresh)
 
-        status = Text()
-        status.append(progress, style="cyan")
-        status.append(f"  Next: {remaining:.0f}s", style="dim")
-        status.append(f"  │  Refresh: {mins_until_refresh}min", style="dim")
+        # The dim fields share one string, so the bar is three styled parts
+        details = f"  Next: {remaining:.0f}s  │  Refresh: {mins_until_refresh}min"
         if engagement:
-            status.append(f"  │  {engagement}", style="dim")
-        status.append(f"  {pos}", style="bold")
+            details += f"  │  {engagement}"
 
-        return status
+        return Text.assemble(
+            (progress, "cyan"),
+            (details, "dim"),
+            (f"  {pos}", "bold"),
+        )
 
     def render_header(self) -> Text:
         """Render the top header bar."""
@@ -164,32 +232,20 @@ class TickerDisplay:
         score = ft.relevance_score
 
         # Calculate opacity for transition effect
-        if elapsed > self.rotate_seconds - 0.3:
-            opacity = max(0.3, (self.rotate_seconds - elapsed) / 0.3)
-        elif elapsed < 0.3:
-            opacity = min(1.0, 0.3 + elapsed / 0.3 * 0.7)
-        else:
-            opacity = 1.0
-
-        dim = opacity < 0.5
+        dim = self.opacity_bucket(elapsed) == 0
 
         # Line 1: @author: tweet content (truncated to fit)
         line1 = Text()
         line1.append(f"{tweet.author_handle}", style="bold cyan" if not dim else "dim")
         line1.append(": ", style="dim")
-        # Leave room for author handle, truncate content
-        max_content = 100 - len(tweet.author_handle)
-        content = tweet.content.replace("\n", " ")
-        if len(content) > max_content:
-            content = content[:max_content - 3] + "..."
-        line1.append(content, style="" if not dim else "dim")
+        line1.append(self._compact_content[self.current_index], style="" if not dim else "dim")
 
         # Line 2: score + engagement + progress
         line2 = Text()
-        score_style = self.get_score_style(score) if not dim else Style(dim=True)
+        score_style = self._score_styles[self.current_index] if not dim else Style(dim=True)
         line2.append(f"[{score}/10]", style=score_style)
 
-        engagement = format_engagement(tweet.likes, tweet.retweets)
+        engagement = self._engagement[self.current_index]
         if engagement:
             line2.append(f"  {engagement}", style="dim")
 
@@ -198,46 +254,78 @@ class TickerDisplay:
 
         return Group(line1, line2)
 
-    def render(self, elapsed: float) -> Group:
+    def render(self, elapsed: float, elapsed_refresh: float = 0.0) -> Group:
         """Render the complete ticker display."""
         if self.compact:
             return self.render_compact(elapsed)
 
         if not self.tweets:
             return Group(
-                self.render_header(),
+                self._header,
                 Text("\nNo relevant tweets found.\n", style="dim italic"),
                 Text("Waiting for refresh...", style="dim"),
             )
 
         # Calculate opacity for transition effect
-        if elapsed > self.rotate_seconds - 0.3:
-            # Fade out
-            opacity = max(0.3, (self.rotate_seconds - elapsed) / 0.3)
-        elif elapsed < 0.3:
-            # Fade in
-            opacity = min(1.0, 0.3 + elapsed / 0.3 * 0.7)
-        else:
-            opacity = 1.0
+        bucket = self.opacity_bucket(elapsed)
+
+        # Reuse the panel built for this tweet and opacity bucket
+        key = (self.current_index, bucket)
+        panel = self._tweet_panels.get(key)
+        if panel is None:
+            panel = self.render_tweet(
+                self.tweets[self.current_index], OPACITY_BY_BUCKET[bucket]
+            )
+            self._tweet_panels[key] = panel
+
+        slots = self._frame.renderables
+        slots[1] = panel
+        slots[2] = self.render_status_bar(elapsed, elapsed_refresh)
+        return self._frame
 
-        current_tweet = self.tweets[self.current_index]
+    def frame_key(self, elapsed: float, elapsed_refresh: float = 0.0) -> tuple:
+        """Everything the rendered frame depends on; equal keys, identical frames."""
+        if not self.tweets:
+            return ()
+
+        bucket = self.opacity_bucket(elapsed)
+        if self.compact:
+            return (
+                self.current_index,
+                bucket == 0,
+                progress_filled(elapsed, self.rotate_seconds, width=8),
+            )
 
-        return Group(
-            Align.center(self.render_header()),
-            self.render_tweet(current_tweet, opacity),
-            self.render_status_bar(elapsed),
+        remaining = max(0, self.rotate_seconds - elapsed)
+        return (
+            self.current_index,
+            bucket,
+            progress_filled(elapsed, self.rotate_seconds),
+            f"{remaining:.0f}",
+            int(elapsed_refresh // 60),
         )
 
+    def render_if_changed(self, elapsed: float, elapsed_refresh: float = 0.0) -> Group | None:
+        """Render the display, or return None if it would match the last frame."""
+        key = self.frame_key(elapsed, elapsed_refresh)
+        if key == self._last_frame_key:
+            return None
+        self._last_frame_key = key
+        return self.render(elapsed, elapsed_refresh)
+
     def advance(self):
         """Move to the next tweet."""
         if self.tweets:
             self.current_index = (self.current_index + 1) % len(self.tweets)
+        self._tweet_panels.clear()
 
     def update_tweets(self, tweets: list[FilteredTweet]):
         """Update the tweet list (called on refresh)."""
         self.tweets = tweets
         self.current_index = 0
-        self.last_refresh = datetime.now()
+        self._tweet_panels.clear()
+        self._last_frame_key = None
+        self._precompute()
 
 
 async def run_ticker(
@@ -271,9 +359,13 @@ async def run_ticker(
     ticker = TickerDisplay(tweets, rotate_seconds, refresh_minutes, compact=compact)
 
     last_rotate = time.time()
+    # When the last fetch finished, successful or not: schedules the next
+    # one and drives the status bar's countdown
     last_refresh = time.time()
+    refresh_task: asyncio.Task | None = None
 
-    with Live(ticker.render(0), console=console, refresh_per_second=10, screen=True) as live:
+    # No auto-refresh: the screen is redrawn only when a frame changes
+    with Live(ticker.render(0), console=console, auto_refresh=False, screen=True) as live:
         try:
             while True:
                 now = time.time()
@@ -286,20 +378,41 @@ async def run_ticker(
                     last_rotate = now
                     elapsed_rotate = 0
 
-                # Check if we need to refresh
-                if elapsed_refresh >= refresh_minutes * 60:
-                    # Fetch new tweets in background
-                    new_tweets = await fetch_func(count, threshold)
+                # Check if a background refresh completed. A failed fetch
+                # keeps the current tweets and is retried next interval.
+                if refresh_task is not None and refresh_task.done():
+                    try:
+                        new_tweets = refresh_task.result()
+                    except Exception:
+                        new_tweets = None
+                    refresh_task = None
+                    last_refresh = now
+                    elapsed_refresh = 0
                     if new_tweets:
                         ticker.update_tweets(new_tweets)
-                    last_refresh = now
 
-                # Update display
-                live.update(ticker.render(elapsed_rotate))
+                # Check if we need to refresh
+                if elapsed_refresh >= refresh_minutes * 60 and refresh_task is None:
+                    # Fetch new tweets in background; the ticker keeps
+                    # rotating until they arrive
+                    refresh_task = asyncio.create_task(fetch_func(count, threshold))
+
+                # Update display, skipping frames identical to the last one
+                frame = ticker.render_if_changed(elapsed_rotate, elapsed_refresh)
+                if frame is not None:
+                    live.update(frame, refresh=True)
 
                 await asyncio.sleep(0.1)
 
         except KeyboardInterrupt:
             pass
+        finally:
+            if refresh_task is not None:
+                # Wait for the cancelled fetch so Playwright can clean up
+                refresh_task.cancel()
+                try:
+                    await refresh_task
+                except (asyncio.CancelledError, Exception):
+                    pass
 
     console.print("\n[dim]Ticker stopped.[/dim]")
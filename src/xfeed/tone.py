@@ -1,32 +1,27 @@
 """Tone analysis for reply notifications using Claude Haiku."""
 
+import asyncio
 import json
+
 import anthropic
 
-from xfeed.config import get_api_key
+from xfeed.config import get_api_key, get_async_client
 from xfeed.models import Notification, NotificationType
 
 
-def analyze_reply_tones(notifications: list[Notification]) -> list[Notification]:
-    """
-    Analyze the tone of reply notifications using Claude Haiku.
-
-    Returns the same notifications with reply_tone field populated
-    with a short descriptive tone (e.g., "curious", "supportive", "hostile").
-    """
-    # Filter to just replies with content
-    replies_with_content = [
-        (i, n) for i, n in enumerate(notifications)
-        if n.type == NotificationType.REPLY and n.reply_content
-    ]
-
-    if not replies_with_content:
-        return notifications
+# Replies per API call; chunks are analyzed concurrently, so the wait is about
+# one call however many replies there are, and each prompt stays short
+TONE_CHUNK_SIZE = 20
 
+async def _analyze_chunk(
+    client: anthropic.AsyncAnthropic,
+    replies: list[tuple[int, Notification]],
+) -> dict[str, str]:
+    """Get the tone map ({index: tone}) for one chunk of (index, reply) pairs."""
     # Build the prompt with context
     replies_text = "\n".join([
         f'{i}: Original: "{n.reply_to_content or "unknown"}"\n   Reply: "{n.reply_content}"'
-        for i, n in replies_with_content
+        for i, n in replies
     ])
 
     prompt = f"""For each reply, describe its tone in ONE word considering the context of what they're replying to. Be creative and precise - capture the vibe.
@@ -39,41 +34,66 @@ Respond with JSON mapping index to tone word:
 JSON only:"""
 
     try:
-        api_key = get_api_key()
-        if not api_key:
-            return notifications
-
-        client = anthropic.Anthropic(api_key=api_key)
-
-        response = client.messages.create(
+        response = await client.messages.create(
             model="claude-3-haiku-20240307",
             max_tokens=500,
             messages=[{"role": "user", "content": prompt}]
         )
 
         # Parse the response
-        response_text = response.content[0].text.strip()
-
-        # Extract JSON from response (handle markdown code blocks)
-        if "```" in response_text:
-            import re
-            json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', response_text)
-            if json_match:
-                response_text = json_match.group(1)
-
-        tone_map = json.loads(response_text)
-
-        # Apply tones to notifications
-        for idx_str, tone in tone_map.items():
-            idx = int(idx_str)
-            # Find the notification at this index in our filtered list
-            for orig_idx, notif in replies_with_content:
-                if orig_idx == idx:
-                    notif.reply_tone = tone.lower()
-                    break
+        response_text = response.content[0].text
+
+        # Extract the JSON object (first "{" to last "}"), which also strips
+        # markdown code fences or any text around it
+        start = response_text.find("{")
+        end = response_text.rfind("}")
+        if start != -1 and end > start:
+            response_text = response_text[start:end + 1]
+
+        return json.loads(response_text)
 
     except Exception:
-        # If analysis fails, leave tones as None
-        pass
+        # If analysis fails, leave this chunk's tones as None
+        return {}
+
+
+async def analyze_reply_tones(notifications: list[Notification]) -> list[Notification]:
+    """
+    Analyze the tone of reply notifications using Claude Haiku.
+
+    Returns the same notifications with reply_tone field populated
+    with a short descriptive tone (e.g., "curious", "supportive", "hostile").
+    """
+    # Filter to just replies with content
+    replies_with_content = [
+        (i, n) for i, n in enumerate(notifications)
+        if n.type == NotificationType.REPLY and n.reply_content
+    ]
+
+    if not replies_with_content:
+        return notifications
+
+    api_key = get_api_key()
+    if not api_key:
+        return notifications
+
+    client = await get_async_client(api_key)
+
+    tone_maps = await asyncio.gather(*[
+        _analyze_chunk(client, replies_with_content[start:start + TONE_CHUNK_SIZE])
+        for start in range(0, len(replies_with_content), TONE_CHUNK_SIZE)
+    ])
+
+    # Apply tones to notifications, looked up by the index in the prompt
+    notif_by_index = dict(replies_with_content)
+    for tone_map in tone_maps:
+        try:
+            for idx_str, tone in tone_map.items():
+                notif = notif_by_index.get(int(idx_str))
+                if notif:
+                    notif.reply_tone = tone.lower()
+        except Exception:
+            # Malformed tone map - leave its remaining tones as None
+            pass
 
     return notifications
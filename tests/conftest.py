@@ -0,0 +1,48 @@
+"""Shared pytest fixtures."""
+
+from types import MappingProxyType
+
+import pytest
+
+from xfeed.reputation import AuthorDB
+
+# Reputation thresholds for the trust and boost tests; read-only, so every
+# test can share the one mapping
+CONFIG = MappingProxyType({
+    "reputation_minimum_samples": 5,
+    "reputation_trusted_threshold": 7.5,
+    "reputation_boost_max": 1.5,
+})
+
+
+@pytest.fixture(scope="session")
+def author_db():
+    """One in-memory AuthorDB for the whole session (schema created once)."""
+    with AuthorDB(db_path=":memory:") as db:
+        yield db
+
+
+@pytest.fixture(scope="session")
+def db_dir(tmp_path_factory):
+    """One directory for every on-disk test database, removed with the session."""
+    return tmp_path_factory.mktemp("authors")
+
+
+@pytest.fixture
+def file_db(db_dir, request):
+    """An AuthorDB in a file of its own, for tests that reopen or inspect it."""
+    with AuthorDB(db_path=db_dir / f"{request.node.name}.db") as db:
+        yield db
+
+
+@pytest.fixture
+def db(author_db):
+    """The shared in-memory AuthorDB, emptied after each test."""
+    yield author_db
+    author_db.clear_all()
+
+
+@pytest.fixture
+def cfg():
+    """Reputation thresholds shared by the trust and boost tests."""
+    return CONFIG
@@ -0,0 +1,272 @@
+"""Tests for the fetcher helpers that don't need a browser."""
+
+import asyncio
+import json
+import stat
+
+import pytest
+from datetime import datetime
+
+from xfeed import fetcher
+from xfeed.fetcher import (
+    parse_count,
+    parse_notification_text,
+    tweet_from_fields,
+    tweets_from_rows,
+)
+from xfeed.models import NotificationType, Tweet
+
+
+def _fields(**overrides) -> dict:
+    """EXTRACT_TWEETS_JS fields for one article, with overrides."""
+    fields = {
+        "href": "/someone/status/123",
+        "userText": "Some One\n@someone",
+        "content": "Hello",
+        "time": "2024-01-02T03:04:05.000Z",
+        "likes": "5",
+        "retweets": "2",
+        "replies": "1",
+    }
+    fields.update(overrides)
+    return fields
+
+
+class TestParseCount:
+    """Tests for parse_count."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("500", 500),
+            (" 42 ", 42),
+            ("1.2K", 1200),
+            ("1.2k", 1200),
+            ("3M", 3_000_000),
+            ("2.5m", 2_500_000),
+            ("1B", 1_000_000_000),
+            ("1.5b", 1_500_000_000),
+            ("", 0),
+            ("   ", 0),
+            (None, 0),
+            ("abc", 0),
+            ("x1K", 0),
+        ],
+    )
+    def test_parse_count(self, text, expected):
+        """Plain, suffixed and invalid counts."""
+        assert parse_count(text) == expected
+
+
+class TestParseNotificationText:
+    """Tests for parse_notification_text."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Alice liked your post", NotificationType.LIKE),
+            ("Alice reposted your post", NotificationType.RETWEET),
+            ("Alice replied to you", NotificationType.REPLY),
+            ("Alice quoted your post", NotificationType.QUOTE),
+            ("Alice followed you", NotificationType.FOLLOW),
+            ("Alice mentioned you", NotificationType.MENTION),
+            ("Alice LIKED YOUR post", NotificationType.LIKE),
+            ("Something else happened", NotificationType.UNKNOWN),
+        ],
+    )
+    def test_notification_type(self, text, expected):
+        """Each type is recognised from its phrase, in any case."""
+        assert parse_notification_text(text)[0] == expected
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            # Earlier types in NOTIFICATION_TYPE_PHRASES win, wherever they appear
+            ("Alice replied and liked your reply", NotificationType.LIKE),
+            ("Alice quoted your post in a reply", NotificationType.REPLY),
+            ("Alice mentioned you and followed you", NotificationType.FOLLOW),
+        ],
+    )
+    def test_phrase_priority(self, text, expected):
+        """When several types' phrases appear, the higher-priority type wins."""
+        assert parse_notification_text(text)[0] == expected
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Alice and 3 others liked your post", 3),
+            ("Alice and 1 other liked your post", 1),
+            ("Alice liked your post", 0),
+        ],
+    )
+    def test_others_count(self, text, expected):
+        """'and N others' sets the additional count."""
+        assert parse_notification_text(text)[2] == expected
+
+
+class TestTweetFromFields:
+    """Tests for tweet_from_fields."""
+
+    @pytest.mark.parametrize(
+        ("time_str", "expected"),
+        [
+            ("2024-01-02T03:04:05.000Z", datetime(2024, 1, 2, 3, 4, 5)),
+            ("2024-01-02T03:04:05Z", datetime(2024, 1, 2, 3, 4, 5)),
+            ("2024-01-02T03:04:05+00:00", datetime(2024, 1, 2, 3, 4, 5)),
+        ],
+    )
+    def test_timestamp_is_naive(self, time_str, expected):
+        """UTC timestamps, with or without a Z suffix, parse to naive datetimes."""
+        tweet = tweet_from_fields(_fields(time=time_str))
+        assert tweet.timestamp == expected
+        assert tweet.timestamp.tzinfo is None
+
+    def test_builds_tweet(self):
+        """Fields map onto the Tweet, with counts parsed and the URL absolute."""
+        tweet = tweet_from_fields(_fields(likes="1.2K", likedByMe=True), "@someone")
+        assert tweet.id == "123"
+        assert tweet.author == "Some One"
+        assert tweet.author_handle == "@someone"
+        assert tweet.likes == 1200
+        assert tweet.url == "https://x.com/someone/status/123"
+        assert tweet.is_by_me
+        assert tweet.is_liked_by_me
+        assert not tweet.is_retweeted_by_me
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"href": ""},
+            {"href": "/someone"},
+            {"userText": None},
+            {"time": "not a time"},
+        ],
+    )
+    def test_invalid_fields_return_none(self, overrides):
+        """Rows without an id or author, or with a bad time, are dropped."""
+        assert tweet_from_fields(_fields(**overrides)) is None
+
+
+class TestTweetsFromRows:
+    """Tests for tweets_from_rows."""
+
+    def test_skipped_and_invalid_rows_dropped(self):
+        """None rows (skipped in-page) and unparseable rows are left out."""
+        rows = [None, _fields(), _fields(href="")]
+        assert [t.id for t in tweets_from_rows(rows)] == ["123"]
+
+    def test_known_rows_refresh_counts(self):
+        """Known-id rows copy the cached tweet with fresh engagement state."""
+        cached = Tweet(
+            id="123",
+            author="Some One",
+            author_handle="@someone",
+            content="Cached content",
+            timestamp=datetime(2024, 1, 2),
+            likes=1,
+        )
+        row = {
+            "href": "/someone/status/123?s=20",
+            "known": True,
+            "likes": "2K",
+            "retweets": "7",
+            "replies": "",
+            "likedByMe": True,
+            "retweetedByMe": False,
+        }
+
+        [tweet] = tweets_from_rows([row], known={"123": cached})
+        assert tweet.content == "Cached content"
+        assert tweet.likes == 2000
+        assert tweet.retweets == 7
+        assert tweet.replies == 0
+        assert tweet.is_liked_by_me
+        assert cached.likes == 1  # The cached tweet itself is untouched
+
+
+class TestSaveSession:
+    """Tests for _save_session."""
+
+    def test_existing_file_made_owner_only(self, tmp_path, monkeypatch):
+        """Saving over a world-readable file should leave it owner-only."""
+        path = tmp_path / "x_state.json"
+        path.write_text("{}")
+        path.chmod(0o644)
+        monkeypatch.setattr(fetcher, "SESSION_STATE_FILE", path)
+
+        fetcher._save_session([{"name": "auth_token", "value": "secret"}])
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert json.loads(path.read_text())["cookies"][0]["value"] == "secret"
+        assert not path.with_suffix(".json.tmp").exists()
+
+
+class _FakeBrowser:
+    """Just enough of a Playwright Browser for the shared-browser tests."""
+
+    def __init__(self, headless: bool):
+        self.headless = headless
+        self.closed = False
+
+    def is_connected(self) -> bool:
+        return not self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakePlaywright:
+    """Stands in for a started Playwright driver, recording launches."""
+
+    def __init__(self):
+        self.chromium = self
+        self.browsers = []
+        self.stopped = False
+
+    async def launch(self, headless: bool) -> _FakeBrowser:
+        self.browsers.append(_FakeBrowser(headless))
+        return self.browsers[-1]
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+class TestSharedBrowser:
+    """Tests for _get_browser and close_browser."""
+
+    @pytest.fixture
+    def drivers(self, monkeypatch):
+        """Every fake driver started, in order."""
+        started = []
+
+        class _Starter:
+            async def start(self):
+                started.append(_FakePlaywright())
+                return started[-1]
+
+        monkeypatch.setattr(fetcher, "async_playwright", _Starter)
+        monkeypatch.setattr(fetcher, "_shared_playwright", None)
+        monkeypatch.setattr(fetcher, "_shared_browsers", {})
+        return started
+
+    def test_modes_get_their_own_browser(self, drivers):
+        """Switching headless mode leaves the other mode's browser open."""
+        async def run():
+            headless = await fetcher._get_browser(headless=True)
+            headed = await fetcher._get_browser(headless=False)
+            assert not headless.closed
+            assert await fetcher._get_browser(headless=True) is headless
+            await fetcher.close_browser()
+            return headless, headed
+
+        headless, headed = asyncio.run(run())
+        assert len(drivers) == 1
+        assert headless.closed and headed.closed
+        assert drivers[0].stopped
+
+    def test_stale_loop_browser_dropped(self, drivers):
+        """A browser left by a finished loop is replaced, not reused."""
+        first = asyncio.run(fetcher._get_browser())
+        second = asyncio.run(fetcher._get_browser())
+        assert second is not first
+        assert len(drivers) == 2
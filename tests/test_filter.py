@@ -106,6 +106,14 @@ class TestExplorationAuthorCache:
         assert "@ancient_user" not in filter_module._exploration_author_cache
         assert "@new_user" in filter_module._exploration_author_cache
 
+    def test_mark_author_seen_keeps_oldest_first(self):
+        """Re-marking an author should move it behind newer entries."""
+        from xfeed import filter as filter_module
+        _mark_author_seen("@first_user")
+        _mark_author_seen("@second_user")
+        _mark_author_seen("@first_user")
+        assert list(filter_module._exploration_author_cache) == ["@second_user", "@first_user"]
+
 
 class TestParseFilterResponse:
     """Tests for parsing LLM filter responses."""
@@ -1,91 +1,247 @@
 """Tests for the author reputation tracking module."""
 
 import pytest
-import tempfile
+import sqlite3
+import time
 from datetime import datetime, timedelta
-from pathlib import Path
 
-from xfeed.reputation import AuthorDB, AuthorStats
+from xfeed.reputation import AuthorDB, AuthorStats, RepParams
 
+# Tweet ids for test rows, formatted once at import; slice what a test needs
+TWEET_IDS = tuple(f"t{i}" for i in range(64))
 
-class TestAuthorDB:
-    """Tests for AuthorDB database operations."""
+# Score rows shared by several tests, built once at import:
+# five 8/10 tweets from @user (enough samples to be trusted)
+FIVE_EIGHTS = [("@user", "User", 8, tid) for tid in TWEET_IDS[:5]]
 
-    def setup_method(self):
-        """Create a temporary database for each test."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test_authors.db"
-        self.db = AuthorDB(db_path=self.db_path)
 
-    def teardown_method(self):
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+class TestAuthorDB:
+    """Tests for AuthorDB database operations."""
 
-    def test_db_initialization(self):
+    def test_db_initialization(self, file_db):
         """Database should be created with correct schema."""
-        assert self.db_path.exists()
+        assert file_db.db_path.exists()
         # Should be able to record a score without error
-        self.db.record_tweet_score("@test", "Test User", 8, "tweet123")
+        file_db.record_tweet_score("@test", "Test User", 8, "tweet123")
+
+    def test_wal_mode_enabled(self, file_db):
+        """Connection should use WAL with NORMAL sync and in-memory temp tables."""
+        conn = file_db._conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
 
-    def test_record_tweet_score(self):
+    def test_record_tweet_score(self, file_db):
         """Recording a score should create author and score entries."""
-        self.db.record_tweet_score("@testuser", "Test User", 8, "tweet1")
+        file_db.record_tweet_score("@testuser", "Test User", 8, "tweet1")
 
-        stats = self.db.get_author_stats("@testuser")
+        stats = file_db.get_author_stats("@testuser")
         assert stats is not None
         assert stats.handle == "@testuser"
         assert stats.display_name == "Test User"
         assert stats.total_tweets_seen == 1
         assert stats.avg_score == 8.0
 
-    def test_handle_normalization(self):
+    def test_record_tweet_scores_batch(self, file_db):
+        """Batch recording should match recording scores one at a time."""
+        file_db.record_tweet_scores([
+            ("@User", "User", 9, "t1"),
+            ("@user", "User", 7, "t2"),
+            ("@other", "Other", 5, "t3"),
+        ])
+
+        stats = file_db.get_author_stats("@user")
+        assert stats.total_tweets_seen == 2
+        assert stats.avg_score == 9.0  # Forgiving avg keeps top 80% (1 of 2)
+        assert file_db.get_author_stats("@other").total_tweets_seen == 1
+
+    def test_record_tweet_scores_large_batch(self, file_db):
+        """Large batches are chunked into multi-row INSERTs."""
+        rows = [(f"@user{i % 7}", "User", i % 10, f"t{i}") for i in range(1200)]
+        file_db.record_tweet_scores(rows)
+
+        summary = file_db.get_stats_summary()
+        assert summary["total_authors"] == 7
+        assert summary["total_scores"] == 1200
+        counts = dict(
+            file_db._conn.execute("SELECT handle, score_count FROM author_agg")
+        )
+        assert counts == {f"@user{i}": len(range(i, 1200, 7)) for i in range(7)}
+
+    def test_handle_normalization(self, file_db):
         """Handles should be normalized to lowercase."""
-        self.db.record_tweet_score("@TestUser", "Test User", 8, "tweet1")
-        self.db.record_tweet_score("@TESTUSER", "Test User", 8, "tweet2")
+        file_db.record_tweet_score("@TestUser", "Test User", 8, "tweet1")
+        file_db.record_tweet_score("@TESTUSER", "Test User", 8, "tweet2")
 
-        stats = self.db.get_author_stats("@testuser")
+        stats = file_db.get_author_stats("@testuser")
         assert stats is not None
         assert stats.total_tweets_seen == 2
         assert stats.avg_score == 8.0
 
-    def test_multiple_scores_forgiving_average(self):
+    def test_mixed_case_handle_rejected_by_schema(self, file_db):
+        """The authors table only accepts lowercase handles."""
+        with pytest.raises(sqlite3.IntegrityError):
+            file_db._conn.execute(
+                "INSERT INTO authors (handle, display_name) VALUES (?, ?)",
+                ("@TestUser", "Test User"),
+            )
+
+    def test_multiple_scores_forgiving_average(self, file_db):
         """Forgiving average ignores worst 20% of scores."""
         # 5 scores: top 80% = 4 scores kept
-        self.db.record_tweet_score("@user", "User", 9, "t1")
-        self.db.record_tweet_score("@user", "User", 9, "t2")
-        self.db.record_tweet_score("@user", "User", 8, "t3")
-        self.db.record_tweet_score("@user", "User", 8, "t4")
-        self.db.record_tweet_score("@user", "User", 2, "t5")  # Bad take - should be forgiven
-
-        stats = self.db.get_author_stats("@user")
+        file_db.record_tweet_scores([
+            ("@user", "User", 9, "t1"),
+            ("@user", "User", 9, "t2"),
+            ("@user", "User", 8, "t3"),
+            ("@user", "User", 8, "t4"),
+            ("@user", "User", 2, "t5"),  # Bad take - should be forgiven
+        ])
+
+        stats = file_db.get_author_stats("@user")
         assert stats.total_tweets_seen == 5
         # Forgiving avg: (9+9+8+8)/4 = 8.5, ignores the 2
         assert stats.avg_score == 8.5
 
-    def test_nonexistent_author_returns_none(self):
+    def test_author_agg_backfilled_on_open(self, file_db):
+        """Opening a DB without author_agg should backfill it from scores."""
+        file_db.record_tweet_score("@user", "User", 8, "t1")
+        file_db.record_tweet_score("@user", "User", 6, "t2")
+        file_db._conn.execute("DROP TABLE author_agg")
+        file_db._conn.commit()
+        file_db.close()
+
+        db = AuthorDB(db_path=file_db.db_path)
+        row = db._conn.execute(
+            "SELECT score_count, score_sum FROM author_agg WHERE handle = ?",
+            ("@user",),
+        ).fetchone()
+        assert tuple(row) == (2, 14)
+        db.close()
+
+    def test_text_timestamps_migrated_to_epoch(self, file_db):
+        """Legacy CURRENT_TIMESTAMP text scored_at values become epoch seconds."""
+        file_db.record_tweet_score("@user", "User", 8, "t1")
+        file_db._conn.execute(
+            "UPDATE tweet_scores SET scored_at = '2024-01-02 03:04:05'"
+        )
+        file_db._conn.execute("PRAGMA user_version = 0")
+        file_db._conn.commit()
+        file_db.close()
+
+        db = AuthorDB(db_path=file_db.db_path)
+        scored_at = db._conn.execute("SELECT scored_at FROM tweet_scores").fetchone()[0]
+        assert scored_at == 1704164645
+        db.close()
+
+    def test_stats_cache_invalidated_on_write(self, file_db):
+        """Cached stats should refresh after a new score is recorded."""
+        file_db.record_tweet_score("@user", "User", 8, "t1")
+        assert file_db.get_author_stats("@user").total_tweets_seen == 1
+        assert file_db.get_author_stats("@user").total_tweets_seen == 1
+
+        file_db.record_tweet_score("@user", "User", 6, "t2")
+        assert file_db.get_author_stats("@user").total_tweets_seen == 2
+
+    def test_stats_cache_kept_for_other_authors(self, file_db, monkeypatch):
+        """Scoring one author should not evict another author's cached stats."""
+        # Fixed clock, so the cache's time bucket can't roll over mid-test
+        monkeypatch.setattr(time, "time", lambda: 1_700_000_000)
+        file_db.record_tweet_score("@user", "User", 8, "t1")
+        stats = file_db.get_author_stats("@user")
+
+        file_db.record_tweet_score("@other", "Other", 6, "t2")
+        assert file_db.get_author_stats("@user") is stats
+
+    def test_stats_cache_expires_with_time_windows(self, file_db, monkeypatch):
+        """Windowed stats should refresh as time moves on, even with no writes."""
+        start = 1_700_000_000
+        monkeypatch.setattr(time, "time", lambda: start)
+        file_db.record_tweet_scores([("@user", "User", 9, tid) for tid in TWEET_IDS[:5]])
+
+        monkeypatch.setattr(time, "time", lambda: start + 25 * 86400)
+        file_db.record_tweet_scores([("@user", "User", 3, tid) for tid in TWEET_IDS[5:10]])
+        before = file_db.get_author_stats("@user")
+
+        # The 9s fall out of the 30-day recent window
+        monkeypatch.setattr(time, "time", lambda: start + 35 * 86400)
+        after = file_db.get_author_stats("@user")
+        assert after.recent_avg_score == 3.0
+        assert after.recent_avg_score != before.recent_avg_score
+        assert after.avg_score == before.avg_score
+
+    def test_author_generations_reset(self, file_db, monkeypatch):
+        """Per-author generations shouldn't outlive a bucket or clear_all."""
+        start = 1_700_000_000
+        monkeypatch.setattr(time, "time", lambda: start)
+        file_db.record_tweet_score("@user", "User", 8, "t1")
+        file_db.get_author_stats("@user")
+        assert file_db._author_generations
+
+        monkeypatch.setattr(time, "time", lambda: start + 86400)
+        assert file_db.get_author_stats("@user").total_tweets_seen == 1
+        assert not file_db._author_generations
+
+        file_db.record_tweet_score("@user", "User", 6, "t2")
+        file_db.clear_all()
+        assert not file_db._author_generations
+
+    def test_stats_cache_recomputed_after_bucket_rollover(self, file_db, monkeypatch):
+        """Stats cached on a rollover mustn't match again once generations restart."""
+        start = 1_700_000_000
+        monkeypatch.setattr(time, "time", lambda: start)
+        file_db.record_tweet_scores(FIVE_EIGHTS)
+
+        monkeypatch.setattr(time, "time", lambda: start + 86400)
+        assert file_db.get_author_stats("@user").total_tweets_seen == 5
+
+        # Same number of writes as before the rollover, so the same generation
+        file_db.record_tweet_scores([("@user", "User", 6, tid) for tid in TWEET_IDS[5:10]])
+        assert file_db.get_author_stats("@user").total_tweets_seen == 10
+
+    def test_author_stats_frozen(self, file_db):
+        """Cached AuthorStats are shared, so they must be immutable."""
+        file_db.record_tweet_score("@user", "User", 8, "t1")
+        stats = file_db.get_author_stats("@user")
+        with pytest.raises(AttributeError):
+            stats.avg_score = 10.0
+
+    def test_nonexistent_author_returns_none(self, file_db):
         """Looking up unknown author should return None."""
-        stats = self.db.get_author_stats("@nobody")
+        stats = file_db.get_author_stats("@nobody")
         assert stats is None
 
-    def test_clear_all(self):
+    def test_clear_all(self, file_db):
         """clear_all should remove all data."""
-        self.db.record_tweet_score("@user1", "User 1", 8, "t1")
-        self.db.record_tweet_score("@user2", "User 2", 7, "t2")
+        file_db.record_tweet_score("@user1", "User 1", 8, "t1")
+        file_db.record_tweet_score("@user2", "User 2", 7, "t2")
 
-        count = self.db.clear_all()
+        count = file_db.clear_all()
         assert count == 2
 
-        assert self.db.get_author_stats("@user1") is None
-        assert self.db.get_author_stats("@user2") is None
+        summary = file_db.get_stats_summary()
+        assert summary["total_authors"] == 0
+        assert summary["total_scores"] == 0
+
+    def test_close(self, file_db):
+        """close() should release the shared connection."""
+        file_db.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            file_db.get_author_stats("@user")
 
-    def test_stats_summary(self):
+    def test_context_manager_closes(self, tmp_path):
+        """Leaving a with block should close the connection."""
+        with AuthorDB(db_path=tmp_path / "test_authors.db") as db:
+            db.record_tweet_score("@user", "User", 8, "t1")
+        with pytest.raises(sqlite3.ProgrammingError):
+            db.get_author_stats("@user")
+
+    def test_stats_summary(self, file_db):
         """get_stats_summary should return correct counts."""
-        self.db.record_tweet_score("@user1", "User 1", 8, "t1")
-        self.db.record_tweet_score("@user1", "User 1", 9, "t2")
-        self.db.record_tweet_score("@user2", "User 2", 5, "t3")
+        file_db.record_tweet_score("@user1", "User 1", 8, "t1")
+        file_db.record_tweet_score("@user1", "User 1", 9, "t2")
+        file_db.record_tweet_score("@user2", "User 2", 5, "t3")
 
-        summary = self.db.get_stats_summary()
+        summary = file_db.get_stats_summary()
         assert summary["total_authors"] == 2
         assert summary["total_scores"] == 3
 
@@ -93,190 +249,122 @@ class TestAuthorDB:
 class TestAuthorTrust:
     """Tests for trust status calculation."""
 
-    def setup_method(self):
-        """Create a temporary database for each test."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test_authors.db"
-        self.db = AuthorDB(db_path=self.db_path)
-        self.config = {
-            "reputation_minimum_samples": 5,
-            "reputation_trusted_threshold": 7.5,
-            "reputation_boost_max": 1.5,
-        }
-
-    def teardown_method(self):
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_not_trusted_below_minimum_samples(self):
+    def test_not_trusted_below_minimum_samples(self, db, cfg):
         """Author with fewer than minimum samples should not be trusted."""
-        for i in range(4):  # Only 4 samples
-            self.db.record_tweet_score("@user", "User", 9, f"t{i}")
+        db.record_tweet_scores(
+            [("@user", "User", 9, tid) for tid in TWEET_IDS[:4]]  # Only 4 samples
+        )
 
-        stats = self.db.get_author_stats("@user", self.config)
+        stats = db.get_author_stats("@user", cfg)
         assert stats.avg_score == 9.0
         assert not stats.is_trusted
 
-    def test_trusted_with_enough_samples_and_high_score(self):
+    def test_trusted_with_enough_samples_and_high_score(self, db, cfg):
         """Author with enough samples and high avg should be trusted."""
-        for i in range(5):
-            self.db.record_tweet_score("@user", "User", 8, f"t{i}")
+        db.record_tweet_scores(FIVE_EIGHTS)
 
-        stats = self.db.get_author_stats("@user", self.config)
+        stats = db.get_author_stats("@user", cfg)
         assert stats.is_trusted
 
-    def test_not_trusted_with_low_average(self):
+    def test_not_trusted_with_low_average(self, db, cfg):
         """Author with enough samples but low avg should not be trusted."""
-        for i in range(5):
-            self.db.record_tweet_score("@user", "User", 5, f"t{i}")
+        db.record_tweet_scores(
+            [("@user", "User", 5, tid) for tid in TWEET_IDS[:5]]
+        )
 
-        stats = self.db.get_author_stats("@user", self.config)
+        stats = db.get_author_stats("@user", cfg)
         assert not stats.is_trusted
 
-    def test_get_trusted_authors(self):
+    def test_get_trusted_authors(self, db, cfg):
         """get_trusted_authors should return only trusted authors."""
-        # Trusted author
-        for i in range(6):
-            self.db.record_tweet_score("@trusted", "Trusted", 9, f"t{i}")
-
-        # Not trusted (low score)
-        for i in range(6):
-            self.db.record_tweet_score("@lowscore", "Low", 5, f"l{i}")
-
-        # Not trusted (few samples)
-        for i in range(2):
-            self.db.record_tweet_score("@fewsamples", "Few", 9, f"f{i}")
+        db.record_tweet_scores(
+            # Trusted author
+            [("@trusted", "Trusted", 9, tid) for tid in TWEET_IDS[:6]]
+            # Not trusted (low score)
+            + [("@lowscore", "Low", 5, tid) for tid in TWEET_IDS[6:12]]
+            # Not trusted (few samples)
+            + [("@fewsamples", "Few", 9, tid) for tid in TWEET_IDS[12:14]]
+        )
 
-        trusted = self.db.get_trusted_authors(config=self.config)
-        handles = [a.handle for a in trusted]
-        assert "@trusted" in handles
-        assert "@lowscore" not in handles
-        assert "@fewsamples" not in handles
+        trusted = db.get_trusted_authors(config=cfg)
+        assert [a.handle for a in trusted] == ["@trusted"]
 
 
 class TestReputationBoost:
     """Tests for reputation boost calculation."""
 
-    def setup_method(self):
-        """Create a temporary database for each test."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test_authors.db"
-        self.db = AuthorDB(db_path=self.db_path)
-        self.config = {
-            "reputation_minimum_samples": 5,
-            "reputation_trusted_threshold": 7.5,
-            "reputation_boost_max": 1.5,
-        }
-
-    def teardown_method(self):
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_no_boost_below_minimum_samples(self):
-        """No boost should be given before minimum samples."""
-        for i in range(3):
-            self.db.record_tweet_score("@user", "User", 10, f"t{i}")
-
-        stats = self.db.get_author_stats("@user", self.config)
-        assert stats.reputation_boost(self.config) == 0.0
-
-    def test_no_boost_for_untrusted(self):
-        """No boost for authors below trust threshold."""
-        for i in range(5):
-            self.db.record_tweet_score("@user", "User", 6, f"t{i}")
-
-        stats = self.db.get_author_stats("@user", self.config)
-        assert stats.reputation_boost(self.config) == 0.0
-
-    def test_boost_scales_with_score(self):
-        """Boost should scale based on score above threshold."""
-        # 8.0 avg = 0.5 above threshold * 0.5 = 0.25 boost
-        for i in range(5):
-            self.db.record_tweet_score("@user", "User", 8, f"t{i}")
-
-        stats = self.db.get_author_stats("@user", self.config)
-        boost = stats.reputation_boost(self.config)
-        assert boost == pytest.approx(0.25)
-
-    def test_boost_capped_at_max(self):
-        """Boost should not exceed configured maximum."""
-        for i in range(5):
-            self.db.record_tweet_score("@user", "User", 10, f"t{i}")
-
-        stats = self.db.get_author_stats("@user", self.config)
-        boost = stats.reputation_boost(self.config)
-        assert boost <= 1.5
+    @pytest.mark.parametrize(
+        ("score", "n", "expected"),
+        [
+            (10, 3, 0.0),  # below minimum samples
+            (6, 5, 0.0),  # below trust threshold
+            (8, 5, 0.25),  # 0.5 above threshold * 0.5
+            (10, 5, 1.25),  # 2.5 above threshold * 0.5, within the max
+        ],
+    )
+    def test_reputation_boost(self, db, cfg, score, n, expected):
+        """Boost should scale with score above threshold, up to the max."""
+        db.record_tweet_scores(
+            [("@user", "User", score, tid) for tid in TWEET_IDS[:n]]
+        )
+
+        stats = db.get_author_stats("@user", cfg)
+        boost = stats.reputation_boost(cfg)
+        assert boost == pytest.approx(expected)
+        assert boost <= cfg["reputation_boost_max"]
+
+    def test_rep_params_match_config_dict(self, db, cfg):
+        """Pre-resolved RepParams should behave like the config dict."""
+        db.record_tweet_scores(FIVE_EIGHTS)
+
+        params = RepParams.from_config(cfg)
+        stats = db.get_author_stats("@user", params)
+        assert stats == db.get_author_stats("@user", cfg)
+        assert stats.reputation_boost(params) == pytest.approx(0.25)
 
 
 class TestTrendDetection:
     """Tests for author trend detection."""
 
-    def setup_method(self):
-        """Create a temporary database for each test."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test_authors.db"
-        self.db = AuthorDB(db_path=self.db_path)
-
-    def teardown_method(self):
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_stable_trend_with_no_history(self):
+    def test_stable_trend_with_no_history(self, db):
         """New author should have stable trend."""
-        self.db.record_tweet_score("@user", "User", 8, "t1")
+        db.record_tweet_score("@user", "User", 8, "t1")
 
-        stats = self.db.get_author_stats("@user")
+        stats = db.get_author_stats("@user")
         assert stats.trend == "stable"
 
-    def test_stable_trend_with_consistent_scores(self):
+    def test_stable_trend_with_consistent_scores(self, db):
         """Consistent scores should result in stable trend."""
-        for i in range(5):
-            self.db.record_tweet_score("@user", "User", 8, f"t{i}")
+        db.record_tweet_scores(FIVE_EIGHTS)
 
-        stats = self.db.get_author_stats("@user")
+        stats = db.get_author_stats("@user")
         assert stats.trend == "stable"
 
 
 class TestGetAllAuthors:
     """Tests for get_all_authors method."""
 
-    def setup_method(self):
-        """Create a temporary database for each test."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test_authors.db"
-        self.db = AuthorDB(db_path=self.db_path)
-
-    def teardown_method(self):
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_get_all_authors_empty(self):
+    def test_get_all_authors_empty(self, db):
         """Empty database should return empty list."""
-        authors = self.db.get_all_authors()
+        authors = db.get_all_authors()
         assert authors == []
 
-    def test_get_all_authors_sorted_by_tweet_count(self):
+    def test_get_all_authors_sorted_by_tweet_count(self, db):
         """Authors should be sorted by tweet count descending."""
-        self.db.record_tweet_score("@user1", "User 1", 8, "t1")
-        for i in range(5):
-            self.db.record_tweet_score("@user2", "User 2", 7, f"t2_{i}")
-        for i in range(3):
-            self.db.record_tweet_score("@user3", "User 3", 9, f"t3_{i}")
-
-        authors = self.db.get_all_authors()
-        assert len(authors) == 3
-        assert authors[0].handle == "@user2"  # 5 tweets
-        assert authors[1].handle == "@user3"  # 3 tweets
-        assert authors[2].handle == "@user1"  # 1 tweet
-
-    def test_get_all_authors_respects_limit(self):
+        db.record_tweet_scores(
+            [("@user1", "User 1", 8, TWEET_IDS[0])]
+            + [("@user2", "User 2", 7, tid) for tid in TWEET_IDS[1:6]]
+            + [("@user3", "User 3", 9, tid) for tid in TWEET_IDS[6:9]]
+        )
+
+        handles = [a.handle for a in db.get_all_authors()]
+        assert handles == ["@user2", "@user3", "@user1"]  # 5, 3 and 1 tweets
+
+    def test_get_all_authors_respects_limit(self, db):
         """Should respect limit parameter."""
-        for i in range(10):
-            self.db.record_tweet_score(f"@user{i}", f"User {i}", 8, f"t{i}")
+        db.record_tweet_scores(
+            [(f"@user{i}", f"User {i}", 8, TWEET_IDS[i]) for i in range(10)]
+        )
 
-        authors = self.db.get_all_authors(limit=5)
+        authors = db.get_all_authors(limit=5)
         assert len(authors) == 5
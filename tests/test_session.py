@@ -0,0 +1,107 @@
+"""Tests for the JSON tweet cache in the session module."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from xfeed import session
+from xfeed.models import (
+    FilteredTweet,
+    LinkSummary,
+    MyEngagementStats,
+    Notification,
+    NotificationType,
+    QuotedTweet,
+    TopicVibe,
+    Tweet,
+)
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    """Point the tweet cache at a file under tmp_path."""
+    path = tmp_path / "tweet_cache.json"
+    monkeypatch.setattr(session, "CACHE_FILE", path)
+    return path
+
+
+def _tweet(tweet_id: str = "123") -> Tweet:
+    """A tweet with a quote and engagement flags, so every field type is cached."""
+    return Tweet(
+        id=tweet_id,
+        author="Some One",
+        author_handle="@someone",
+        content="Hello",
+        timestamp=datetime(2024, 1, 2, 3, 4, 5),
+        likes=5,
+        quoted_tweet=QuotedTweet(author="Other", author_handle="@other", content="Quoted"),
+        is_liked_by_me=True,
+    )
+
+
+def _age_cache(cache_file, minutes: float) -> None:
+    """Rewrite the cache's cached_at to `minutes` ago."""
+    data = json.loads(cache_file.read_text(encoding="utf-8"))
+    data["cached_at"] = (datetime.now() - timedelta(minutes=minutes)).isoformat()
+    cache_file.write_text(json.dumps(data), encoding="utf-8")
+
+
+class TestTweetCache:
+    """Tests for saving and loading the tweet cache."""
+
+    def test_roundtrip(self, cache_file):
+        """Every cached model should load back equal to what was saved."""
+        tweets = [FilteredTweet(
+            tweet=_tweet(),
+            relevance_score=8,
+            reason="Relevant",
+            link_summaries=[LinkSummary(url="https://a.b", title="T", summary="S")],
+        )]
+        vibes = [TopicVibe(topic="AI", vibe="Excited", emoji="🔥", description="D", tweet_count=2)]
+        stats = MyEngagementStats(
+            my_handle="@me",
+            profile_tweets=[_tweet("456")],
+            recent_notifications=[Notification(
+                type=NotificationType.REPLY,
+                actor_handle="@fan",
+                actor_name="Fan",
+                timestamp=datetime(2024, 1, 2, 3, 4, 5),
+                reply_content="Nice",
+            )],
+            top_likers=[("@fan", 3)],
+        )
+
+        session.save_tweet_cache(tweets, vibes, stats, "@me")
+        cache = session.load_tweet_cache()
+
+        assert cache["tweets"] == tweets
+        assert cache["vibes"] == vibes
+        assert cache["engagement_stats"] == stats
+        assert cache["my_handle"] == "@me"
+        assert not cache_file.with_suffix(".json.tmp").exists()
+
+    def test_invalid_cache_ignored(self, cache_file):
+        """A missing, truncated or empty cache loads as None."""
+        assert session.load_tweet_cache() is None
+
+        cache_file.write_text('{"tweets": [', encoding="utf-8")
+        assert session.load_tweet_cache() is None
+
+        session.save_tweet_cache([])
+        assert session.load_tweet_cache() is None
+
+    def test_recent_cached_tweets_keyed_by_id(self, cache_file):
+        """A fresh cache's tweets are reusable, keyed by id."""
+        session.save_tweet_cache([FilteredTweet(tweet=_tweet(), relevance_score=8, reason="R")])
+        assert session.load_recent_cached_tweets() == {"123": _tweet()}
+
+    def test_recent_cached_tweets_expire(self, cache_file):
+        """Tweets cached longer ago than the reuse window aren't reused."""
+        session.save_tweet_cache([FilteredTweet(tweet=_tweet(), relevance_score=8, reason="R")])
+
+        _age_cache(cache_file, session.TWEET_CACHE_REUSE_MINUTES - 1)
+        assert "123" in session.load_recent_cached_tweets()
+
+        _age_cache(cache_file, session.TWEET_CACHE_REUSE_MINUTES + 1)
+        assert session.load_recent_cached_tweets() == {}
@@ -0,0 +1,99 @@
+"""Tests for the vibe analysis helpers in the summarizer."""
+
+import pytest
+from datetime import datetime
+
+from xfeed.models import FilteredTweet, Tweet
+from xfeed.summarizer import (
+    VIBE_DEDUP_PREFIX,
+    VIBE_MIN_RELEVANCE,
+    parse_vibe_response,
+    select_tweets_for_vibe,
+    vibe_cache_key,
+)
+
+
+def _filtered(tweet_id: str, content: str = "Hello", score: int = 8) -> FilteredTweet:
+    """A FilteredTweet with the given id, content and relevance score."""
+    tweet = Tweet(
+        id=tweet_id,
+        author="Some One",
+        author_handle="@someone",
+        content=content,
+        timestamp=datetime(2024, 1, 2),
+    )
+    return FilteredTweet(tweet=tweet, relevance_score=score, reason="Relevant")
+
+
+class TestSelectTweetsForVibe:
+    """Tests for select_tweets_for_vibe."""
+
+    def test_low_relevance_dropped(self):
+        """Tweets scored below VIBE_MIN_RELEVANCE are left out."""
+        tweets = [
+            _filtered("1", "a", score=VIBE_MIN_RELEVANCE - 1),
+            _filtered("2", "b", score=VIBE_MIN_RELEVANCE),
+            _filtered("3", "c", score=9),
+        ]
+        assert [ft.tweet.id for ft in select_tweets_for_vibe(tweets)] == ["2", "3"]
+
+    def test_duplicate_prefix_dropped(self):
+        """Tweets starting with the same VIBE_DEDUP_PREFIX chars are sent once."""
+        prefix = "x" * VIBE_DEDUP_PREFIX
+        tweets = [
+            _filtered("1", prefix + " first"),
+            _filtered("2", prefix + " second"),
+            _filtered("3", prefix[:-1] + "y"),
+        ]
+        assert [ft.tweet.id for ft in select_tweets_for_vibe(tweets)] == ["1", "3"]
+
+    def test_dropped_duplicate_does_not_hide_later_tweets(self):
+        """A low-relevance tweet doesn't claim its prefix for later tweets."""
+        tweets = [_filtered("1", "same", score=1), _filtered("2", "same")]
+        assert [ft.tweet.id for ft in select_tweets_for_vibe(tweets)] == ["2"]
+
+
+class TestVibeCacheKey:
+    """Tests for vibe_cache_key."""
+
+    def test_stable_across_order(self):
+        """The same tweets in any order give the same key."""
+        tweets = [_filtered("1"), _filtered("2"), _filtered("3")]
+        assert vibe_cache_key(tweets, "AI") == vibe_cache_key(tweets[::-1], "AI")
+
+    @pytest.mark.parametrize(
+        ("tweets", "objectives"),
+        [
+            ([_filtered("1"), _filtered("2")], "AI"),  # Different tweet set
+            ([_filtered("1"), _filtered("3", score=9)], "AI"),  # Different score
+            ([_filtered("1"), _filtered("3")], "Rust"),  # Different objectives
+        ],
+    )
+    def test_changes_with_inputs(self, tweets, objectives):
+        """Tweet ids, scores and objectives all feed the key."""
+        base = vibe_cache_key([_filtered("1"), _filtered("3")], "AI")
+        assert vibe_cache_key(tweets, objectives) != base
+
+
+class TestParseVibeResponse:
+    """Tests for parse_vibe_response."""
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            '[{"topic": "AI"}]',
+            '```json\n[{"topic": "AI"}]\n```',
+            'Here are the topics:\n[{"topic": "AI"}]\nHope that helps!',
+        ],
+    )
+    def test_array_extracted(self, response):
+        """The JSON array is found with or without fences and surrounding text."""
+        assert parse_vibe_response(response) == [{"topic": "AI"}]
+
+    @pytest.mark.parametrize(
+        "response",
+        ["", "No topics today", "[not json]", '[{"topic": "AI"'],
+    )
+    def test_garbage_returns_empty(self, response):
+        """Unparseable output gives an empty list."""
+        assert parse_vibe_response(response) == []
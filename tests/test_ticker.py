@@ -0,0 +1,82 @@
+"""Tests for the ticker's refresh loop."""
+
+import asyncio
+import time
+from datetime import datetime
+
+from xfeed import ticker
+from xfeed.models import FilteredTweet, Tweet
+from xfeed.ticker import TickerDisplay, run_ticker
+
+# Seconds the fake clock advances per loop iteration
+STEP_SECONDS = 10
+
+
+class _FakeLive:
+    """Stands in for rich's Live, which would take over the terminal."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def update(self, *args, **kwargs):
+        pass
+
+
+def _filtered() -> FilteredTweet:
+    """A relevant tweet for the initial fetch."""
+    tweet = Tweet(
+        id="123",
+        author="Some One",
+        author_handle="@someone",
+        content="Hello",
+        timestamp=datetime(2024, 1, 2),
+    )
+    return FilteredTweet(tweet=tweet, relevance_score=8, reason="Relevant")
+
+
+class TestRunTicker:
+    """Tests for run_ticker."""
+
+    def test_failed_refresh_restarts_countdown(self, monkeypatch):
+        """After a failed fetch the countdown restarts with the retry schedule."""
+        clock = [0.0]
+        real_sleep = asyncio.sleep
+        fetch_times = []
+        countdowns = []
+
+        async def fetch(count, threshold):
+            fetch_times.append(clock[0])
+            if len(fetch_times) > 1:
+                raise RuntimeError("fetch failed")
+            return [_filtered()]
+
+        async def fake_sleep(seconds):
+            clock[0] += STEP_SECONDS
+            if clock[0] > 200:
+                raise KeyboardInterrupt
+            await real_sleep(0)  # Let the refresh task run
+
+        render_if_changed = TickerDisplay.render_if_changed
+
+        def record_countdown(self, elapsed, elapsed_refresh=0.0):
+            countdowns.append(elapsed_refresh)
+            return render_if_changed(self, elapsed, elapsed_refresh)
+
+        monkeypatch.setattr(time, "time", lambda: clock[0])
+        monkeypatch.setattr(ticker.asyncio, "sleep", fake_sleep)
+        monkeypatch.setattr(ticker, "Live", _FakeLive)
+        monkeypatch.setattr(TickerDisplay, "render_if_changed", record_countdown)
+
+        asyncio.run(run_ticker(fetch, refresh_minutes=1))
+
+        # Failed refreshes are retried every interval...
+        assert len(fetch_times) >= 3
+        # ...and the countdown restarts with them, so the status bar never
+        # sits at "Refresh: 0min" waiting for a fetch that isn't due
+        assert max(countdowns) < 60 + 2 * STEP_SECONDS